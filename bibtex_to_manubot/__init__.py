@@ -2,11 +2,37 @@
 BibTeX to Manubot Converter Package
 
 A Python package for converting BibTeX files to Manubot-formatted YAML citations.
+
+Public names are loaded lazily (PEP 562) so that importing the package, e.g.
+for ``bibtex-to-manubot --help``, does not pull in bibtexparser or requests
+until they are actually used.
 """
 
-from .converter import BibTeXConverter
-from .models import BibTeXEntry, ManubotCitation, ConversionResult
-from .config import Config
+import importlib
 
 __version__ = "0.1.0"
-__all__ = ["BibTeXConverter", "BibTeXEntry", "ManubotCitation", "ConversionResult", "Config"]
\ No newline at end of file
+__all__ = ["BibTeXConverter", "BibTeXEntry", "ManubotCitation", "ConversionResult", "Config"]
+
+# Maps each public name to the submodule that defines it
+_LAZY_IMPORTS = {
+    "BibTeXConverter": ".converter",
+    "BibTeXEntry": ".models",
+    "ManubotCitation": ".models",
+    "ConversionResult": ".models",
+    "Config": ".config",
+}
+
+
+def __getattr__(name):
+    """Import public names on first access and cache them on the package."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
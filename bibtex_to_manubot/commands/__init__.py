@@ -0,0 +1,6 @@
+"""
+CLI subcommands, one module per command.
+
+Each module exposes its click command as ``cmd`` and is imported only when
+that command is invoked (see ``LazyGroup`` in ``__main__``).
+"""
@@ -0,0 +1,339 @@
+"""
+``convert`` command: BibTeX files or a DBLP profile to Manubot YAML.
+"""
+
+from __future__ import annotations
+
+import atexit
+import click
+from typing import Optional, List
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import fnmatch
+import glob
+import os
+import shutil
+import sys
+import time
+
+from ..converter import BibTeXConverter
+from ..models import BatchConversionResult, ConversionResult
+from ..utils import is_dblp_host_url
+
+# Read buffer for BibTeX inputs: large enough to amortize read syscalls,
+# small enough not to bloat the working set (multi-MB buffers are slower)
+_BIBTEX_BUFFER_SIZE = 64 * 1024
+
+# Status glyphs, chosen once: plain ASCII when stdout cannot encode Unicode
+_UTF_STDOUT = (getattr(sys.stdout, 'encoding', None) or '').lower().startswith('utf')
+_OK, _FAIL, _WARN, _ARROW = ('✓', '✗', '⚠', '→') if _UTF_STDOUT else ('[ok]', '[fail]', '[warn]', '->')
+
+
+def _open_bibtex(path: str):
+    """Open a BibTeX file for binary reading with a moderate fixed buffer."""
+    return open(path, 'rb', buffering=_BIBTEX_BUFFER_SIZE)
+
+
+def _iter_bibtex_streams(paths: List[str]):
+    """Yield each BibTeX file opened in turn, closing it before the next."""
+    for path in paths:
+        with _open_bibtex(path) as stream:
+            yield stream
+
+
+def _remove_file(path: str):
+    """Delete a temporary file if it still exists (used as an atexit hook)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _match_files(pattern: str) -> List[str]:
+    """Expand a wildcard path to the regular files it matches.
+    
+    Wildcards in the file name are matched against a single ``os.scandir``
+    listing, which also tells us the entries exist. Patterns with wildcards
+    in the directory part fall back to ``glob``.
+    """
+    directory, name_pattern = os.path.split(pattern)
+    if glob.has_magic(directory):
+        return [path for path in glob.glob(pattern) if os.path.isfile(path)]
+    
+    # Like glob, only match hidden files when the pattern asks for them
+    include_hidden = name_pattern.startswith('.')
+    matches = []
+    try:
+        with os.scandir(directory or '.') as entries:
+            for entry in entries:
+                if (fnmatch.fnmatch(entry.name, name_pattern)
+                        and (include_hidden or not entry.name.startswith('.'))
+                        and entry.is_file()):
+                    matches.append(os.path.join(directory, entry.name))
+    except OSError:
+        return []
+    
+    return matches
+
+
+def _default_output_path(input_files: List[str], pid: Optional[str] = None,
+                         is_dblp: bool = False) -> str:
+    """Derive an output YAML name when the user did not pass --output."""
+    if is_dblp:
+        # Create meaningful filename from the DBLP person ID
+        if pid:
+            return f"dblp_{pid.replace('/', '_')}_citations.yaml"
+        return "dblp_citations.yaml"
+    
+    if len(input_files) == 1:
+        input_stem = os.path.splitext(os.path.basename(input_files[0]))[0]
+        return f"{input_stem}_manubot.yaml"
+    
+    return "citations.yaml"
+
+
+def _tally_results(conversions: List[ConversionResult], detail_lines: Optional[List[str]] = None):
+    """Count warnings and errors, collecting the verbose per-entry lines in the same pass.
+    
+    Args:
+        conversions: Conversion results to summarize.
+        detail_lines: List to append the verbose result lines to, or None to skip them.
+    
+    Returns:
+        Tuple of (total warnings, total errors).
+    """
+    total_warnings = 0
+    total_errors = 0
+    for i, conversion in enumerate(conversions, 1):
+        total_warnings += len(conversion.warnings)
+        total_errors += len(conversion.errors)
+        if detail_lines is None:
+            continue
+        
+        status = _OK if conversion.success else _FAIL
+        detail_lines.append(f"{i:3d}. {status} {conversion.original_key}")
+        
+        if conversion.success and conversion.manubot_citation:
+            detail_lines.append(f"     {_ARROW} {conversion.manubot_citation.id}")
+            for warning in conversion.warnings:
+                detail_lines.append(click.style(f"     {_WARN} {warning}", fg='yellow'))
+        elif not conversion.success:
+            for error in conversion.errors:
+                detail_lines.append(f"     {_FAIL} {error}")
+    return total_warnings, total_errors
+
+
+def _convert_one(path: str, config_path: Optional[str]) -> List[ConversionResult]:
+    """Convert a single BibTeX file in a worker process."""
+    # Files are the unit of parallelism here, so entries stay in this worker
+    converter = BibTeXConverter(config_path, in_worker=True)
+    with _open_bibtex(path) as stream:
+        return converter.batch_convert_streams([stream]).conversions
+
+
+def _convert_parallel(converter: BibTeXConverter, input_files: List[str],
+                      config_path: Optional[str], output_path: str) -> BatchConversionResult:
+    """Convert several BibTeX files across worker processes and save one YAML file."""
+    start_time = time.time()
+    
+    max_workers = min(os.cpu_count() or 1, len(input_files))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        conversions = [
+            conversion
+            for file_conversions in executor.map(_convert_one, input_files, repeat(config_path))
+            for conversion in file_conversions
+        ]
+    
+    successful = sum(1 for c in conversions if c.success)
+    result = BatchConversionResult(
+        input_files=input_files,
+        total_entries=len(conversions),
+        successful_conversions=successful,
+        failed_conversions=len(conversions) - successful,
+        conversions=conversions,
+        processing_time=time.time() - start_time
+    )
+    converter.save_yaml(result, output_path)
+    
+    return result
+
+
+@click.command('convert')
+@click.option('--input', '-i', 'input_path', required=True,
+              help='BibTeX file(s) to convert (supports wildcards like *.bib) or DBLP profile URL')
+@click.option('--output', '-o', 'output_path', type=click.Path(), 
+              help='Output YAML file path (default: citations.yaml)')
+@click.option('--config', '-c', 'config_path', type=click.Path(exists=True),
+              help='Configuration file path')
+@click.option('--validate', is_flag=True, 
+              help='Validate output YAML format after conversion')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+@click.option('--include-failed', is_flag=True, default=True,
+              help='Include failed conversions in output YAML')
+def main(input_path: str, output_path: Optional[str], config_path: Optional[str], 
+         validate: bool, verbose: bool, include_failed: bool):
+    """BibTeX to Manubot Converter - Convert BibTeX files to Manubot YAML format."""
+    
+    # Check if input is a DBLP URL
+    is_dblp_url = is_dblp_host_url(input_path)
+    
+    if is_dblp_url:
+        # Handle DBLP profile URL (requests/BeautifulSoup are only imported here)
+        from ..dblp_scraper import DBLPScraper, parse_dblp_url
+        
+        is_valid, result, pid = parse_dblp_url(input_path)
+        if not is_valid:
+            click.echo(f"Error: {result}", err=True)
+            return
+        
+        dblp_url = result
+        if verbose:
+            click.echo(f"DBLP Profile URL: {dblp_url}")
+        
+        # Scrape DBLP profile to get BibTeX
+        try:
+            scraper = DBLPScraper(delay=1.0)
+            
+            # Get profile info for user feedback
+            if verbose:
+                info = scraper.get_profile_info(dblp_url)
+                if info.get('name'):
+                    click.echo(f"Author: {info['name']}")
+                if info.get('publication_count'):
+                    click.echo(f"Estimated publications: {info['publication_count']}")
+            
+            # Download BibTeX to temporary file, removed when the process exits
+            temp_bibtex_path = scraper.scrape_profile_to_file(dblp_url)
+            atexit.register(_remove_file, temp_bibtex_path)
+            input_files = [temp_bibtex_path]
+            
+        except Exception as e:
+            click.echo(f"Error fetching DBLP profile: {e}", err=True)
+            return
+    else:
+        # Handle file paths with wildcards
+        input_files = []
+        is_pattern = '*' in input_path or '?' in input_path
+        if is_pattern:
+            input_files = _match_files(input_path)
+            if not input_files:
+                click.echo(f"Error: No files found matching pattern: {input_path}", err=True)
+                return
+        else:
+            input_files = [input_path]
+    
+    # Verify input files exist (wildcard matches come from a directory listing)
+    missing_files = []
+    if is_dblp_url or not is_pattern:
+        for file_path in input_files:
+            if not os.path.exists(file_path):
+                missing_files.append(file_path)
+    
+    if missing_files:
+        click.echo(f"Error: Input file(s) not found: {', '.join(missing_files)}", err=True)
+        return
+    
+    # Set default output path
+    if not output_path:
+        output_path = _default_output_path(input_files, pid if is_dblp_url else None, is_dblp_url)
+    
+    # Initialize converter
+    try:
+        converter = BibTeXConverter(config_path)
+    except Exception as e:
+        click.echo(f"Error initializing converter: {e}", err=True)
+        return
+    
+    if verbose:
+        click.echo(f"Input files: {', '.join(input_files)}")
+        click.echo(f"Output file: {output_path}")
+        click.echo("Converting BibTeX to Manubot format...")
+    
+    try:
+        # Convert files, spreading several local files across processes
+        if len(input_files) > 1 and not is_dblp_url:
+            result = _convert_parallel(converter, input_files, config_path, output_path)
+        else:
+            result = converter.batch_convert_streams(_iter_bibtex_streams(input_files), output_path)
+        
+        # Display summary
+        click.echo('\n'.join([
+            f"\nConversion Summary:",
+            f"Input files: {len(result.input_files)}",
+            f"Total entries: {result.total_entries}",
+            f"Successful conversions: {result.successful_conversions}",
+            f"Failed conversions: {result.failed_conversions}",
+            f"Success rate: {result.success_rate:.1f}%",
+            f"Processing time: {result.processing_time:.2f}s",
+            f"Output saved to: {output_path}",
+        ]))
+        
+        # Show detailed results if verbose
+        detail_lines = [] if verbose else None
+        total_warnings, total_errors = _tally_results(result.conversions, detail_lines)
+        if detail_lines:
+            click.echo(f"\nDetailed Results:")
+            # Only page when the listing would scroll off the terminal
+            if sys.stdout.isatty() and len(detail_lines) > shutil.get_terminal_size().lines:
+                click.echo_via_pager('\n'.join(detail_lines))
+            else:
+                click.echo('\n'.join(detail_lines))
+        
+        # Show warnings and errors summary
+        if total_warnings > 0:
+            click.echo(f"\nTotal warnings: {total_warnings}")
+        if total_errors > 0:
+            click.echo(f"Total errors: {total_errors}")
+        
+        # Validate output if requested
+        if validate:
+            click.echo(f"\nValidating output format...")
+            try:
+                validation_result = converter.validate_citations(result.conversions)
+                
+                if validation_result['valid']:
+                    click.echo(f"{_OK} Output YAML format is valid")
+                else:
+                    click.echo(f"{_FAIL} Output YAML format has issues:")
+                    for error in validation_result['errors']:
+                        click.echo(f"  - {error}")
+                
+                if validation_result['warnings']:
+                    click.echo("Validation warnings:")
+                    for warning in validation_result['warnings']:
+                        click.echo(f"  - {warning}")
+                
+                # Show citation type distribution
+                if validation_result['citation_types']:
+                    click.echo(f"\nCitation Types:")
+                    for ctype, count in validation_result['citation_types'].items():
+                        click.echo(f"  {ctype}: {count}")
+            
+            except Exception as e:
+                click.echo(f"Validation error: {e}", err=True)
+        
+        # Show sample citations if verbose
+        if verbose and result.successful_conversions > 0:
+            sample_lines = [f"\nSample Citations (first 3):"]
+            successful_citations = result.get_successful_citations()
+            for i, citation in enumerate(successful_citations[:3], 1):
+                sample_lines.append(f"{i}. {citation.id}")
+                if citation.title:
+                    title = citation.title[:60] + "..." if len(citation.title) > 60 else citation.title
+                    sample_lines.append(f"   Title: {title}")
+                if citation.authors:
+                    authors = ", ".join(citation.authors[:3])
+                    if len(citation.authors) > 3:
+                        authors += " et al."
+                    sample_lines.append(f"   Authors: {authors}")
+            click.echo('\n'.join(sample_lines))
+    
+    except Exception as e:
+        click.echo(f"Error during conversion: {e}", err=True)
+        if verbose:
+            import traceback
+            traceback.print_exc()
+
+
+# Looked up by the CLI's lazy command group
+cmd = main
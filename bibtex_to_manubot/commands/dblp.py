@@ -0,0 +1,120 @@
+"""
+``dblp`` command: a DBLP profile straight to Manubot YAML.
+"""
+
+from __future__ import annotations
+
+import click
+from typing import Optional
+import os
+
+from ..converter import BibTeXConverter
+from .convert import _default_output_path
+
+
+@click.command('dblp')
+@click.option('--dblp-url', '-u', required=True,
+              help='DBLP profile URL (e.g., https://dblp.org/pid/154/4313.html)')
+@click.option('--output', '-o', 'output_path', type=click.Path(),
+              help='Output YAML file path (default: dblp_citations.yaml)')
+@click.option('--validate', is_flag=True,
+              help='Validate output YAML format after conversion')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def dblp(dblp_url: str, output_path: Optional[str], validate: bool, verbose: bool):
+    """Convert DBLP profile directly to website-ready YAML format."""
+    from ..dblp_scraper import DBLPScraper, parse_dblp_url
+    
+    # Validate DBLP URL
+    is_valid, result, pid = parse_dblp_url(dblp_url)
+    if not is_valid:
+        click.echo(f"Error: {result}", err=True)
+        return
+    
+    normalized_url = result
+    
+    if verbose:
+        click.echo(f"DBLP Profile: {normalized_url}")
+    
+    try:
+        # Initialize scraper and converter
+        scraper = DBLPScraper(delay=1.0)
+        converter = BibTeXConverter()
+        
+        # Get profile info
+        if verbose:
+            click.echo("Fetching profile information...")
+            info = scraper.get_profile_info(normalized_url)
+            if info.get('name'):
+                click.echo(f"Author: {info['name']}")
+            if info.get('publication_count'):
+                click.echo(f"Estimated publications: {info['publication_count']}")
+        
+        # Set default output path
+        if not output_path:
+            output_path = _default_output_path([], pid, is_dblp=True)
+        
+        # Scrape BibTeX data
+        click.echo("Downloading BibTeX data from DBLP...")
+        temp_bibtex_path = scraper.scrape_profile_to_file(normalized_url)
+        
+        try:
+            # Convert to website format
+            result = converter.batch_convert([temp_bibtex_path], output_path)
+            
+            # Display results
+            click.echo('\n'.join([
+                f"\n🎉 Conversion Complete!",
+                f"📊 Statistics:",
+                f"  • Total entries: {result.total_entries}",
+                f"  • Successful conversions: {result.successful_conversions}",
+                f"  • Failed conversions: {result.failed_conversions}",
+                f"  • Success rate: {result.success_rate:.1f}%",
+                f"  • Processing time: {result.processing_time:.2f}s",
+                f"📄 Output saved to: {output_path}",
+            ]))
+            
+            # Validate if requested
+            if validate:
+                click.echo(f"\nValidating output format...")
+                validation_result = converter.validate_citations(result.conversions)
+                
+                if validation_result['valid']:
+                    click.echo("✓ Output YAML format is valid")
+                else:
+                    click.echo("✗ Output YAML format has issues:")
+                    for error in validation_result['errors']:
+                        click.echo(f"  - {error}")
+                
+                # Show citation type distribution
+                if validation_result['citation_types']:
+                    click.echo(f"\nCitation Types:")
+                    for ctype, count in validation_result['citation_types'].items():
+                        click.echo(f"  {ctype}: {count}")
+            
+            # Show sample citations
+            if result.successful_conversions > 0:
+                sample_lines = [f"\nSample Citations (first 3):"]
+                successful_citations = result.get_successful_citations()
+                for i, citation in enumerate(successful_citations[:3], 1):
+                    sample_lines.append(f"{i}. {citation.id}")
+                    if citation.title:
+                        title = citation.title[:60] + "..." if len(citation.title) > 60 else citation.title
+                        sample_lines.append(f"   Title: {title}")
+                click.echo('\n'.join(sample_lines))
+        
+        finally:
+            # Clean up temporary file
+            if os.path.exists(temp_bibtex_path):
+                os.remove(temp_bibtex_path)
+                if verbose:
+                    click.echo(f"Cleaned up temporary file: {temp_bibtex_path}")
+    
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        if verbose:
+            import traceback
+            traceback.print_exc()
+
+
+# Looked up by the CLI's lazy command group
+cmd = dblp
@@ -0,0 +1,44 @@
+"""
+``validate`` command: check an existing Manubot YAML file.
+"""
+
+import click
+
+from ..converter import BibTeXConverter
+
+
+@click.command('validate')
+@click.option('--yaml-file', '-y', required=True, type=click.Path(exists=True),
+              help='YAML file to validate')
+def validate_yaml(yaml_file: str):
+    """Validate a Manubot YAML file format."""
+    try:
+        converter = BibTeXConverter()
+        result = converter.validate_manubot_format(yaml_file)
+        
+        click.echo(f"Validating: {yaml_file}")
+        click.echo(f"Citations found: {result['citation_count']}")
+        
+        if result['valid']:
+            click.echo("✓ YAML format is valid for Manubot")
+        else:
+            click.echo("✗ YAML format has issues:")
+            for error in result['errors']:
+                click.echo(f"  - {error}")
+        
+        if result['warnings']:
+            click.echo("Warnings:")
+            for warning in result['warnings']:
+                click.echo(f"  - {warning}")
+        
+        if result['citation_types']:
+            click.echo(f"\nCitation Types:")
+            for ctype, count in result['citation_types'].items():
+                click.echo(f"  {ctype}: {count}")
+    
+    except Exception as e:
+        click.echo(f"Validation error: {e}", err=True)
+
+
+# Looked up by the CLI's lazy command group
+cmd = validate_yaml
@@ -3,14 +3,81 @@ Configuration management for BibTeX to Manubot converter.
 """
 
 import os
+import copy
+import warnings
 import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 from pathlib import Path
 
+# Prefer the libyaml-backed loader/dumper; the pure-Python ones are much slower
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _CDumper
+except ImportError:
+    from yaml import SafeLoader as _Loader
+    _CDumper = None
+    warnings.warn(
+        "PyYAML was installed without libyaml bindings; falling back to the "
+        "slower pure-Python loader and dumper",
+        ImportWarning
+    )
+
+
+# Shared default configuration. Treat as read-only: it is handed out by
+# reference, so use Config.copy() when a mutable configuration is needed.
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    'citation_priority': (
+        'doi',
+        'pmid',
+        'pmcid',
+        'arxiv',
+        'isbn',
+        'url'
+    ),
+    'bibtex': {
+        'encoding': 'utf-8',
+        'strict_parsing': False
+    },
+    'output': {
+        'include_metadata': True,
+        'format': 'yaml',
+        'yaml_dumper': 'c'
+    },
+    'conversion': {
+        'max_workers': None,  # None: one worker per CPU
+        'parallel_threshold': 2000  # entries needed before using worker processes
+    }
+}
+
+
+def get_yaml_loader():
+    """Return the fastest available safe YAML loader class."""
+    return _Loader
+
+
+def get_yaml_dumper(name: str = 'c'):
+    """Return the safe YAML dumper class for an ``output.yaml_dumper`` setting.
+    
+    Args:
+        name: 'c' for libyaml's CSafeDumper (when installed), anything else
+            for the pure-Python SafeDumper
+            
+    Returns:
+        PyYAML dumper class
+    """
+    if name == 'c' and _CDumper is not None:
+        return _CDumper
+    return yaml.SafeDumper
+
+
+# Marks key paths that are absent from the configuration in the lookup cache
+_MISSING = object()
+
 
 class Config:
     """Configuration manager for the BibTeX to Manubot converter."""
     
+    __slots__ = ('config_path', '_config', '_get_cache', '_priority_order', '_priority_set')
+    
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration.
         
@@ -18,38 +85,59 @@ class Config:
             config_path: Path to configuration file. If None, uses default configuration.
         """
         self.config_path = config_path
+        self._get_cache: Dict[str, Any] = {}
         self.config = self._load_config() if config_path else self._get_default_config()
     
+    @property
+    def config(self) -> Dict[str, Any]:
+        """The configuration dictionary."""
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        # Cached lookups describe the old dictionary, so drop them
+        self._config = value
+        self._get_cache.clear()
+        self._priority_order = None
+        self._priority_set = None
+    
+    def reload(self):
+        """Reload configuration from file and clear cached lookups."""
+        self.config = self._load_config() if self.config_path else self._get_default_config()
+    
+    @property
+    def priority_order(self) -> Tuple[str, ...]:
+        """Identifier types in the order they should be tried."""
+        if self._priority_order is None:
+            self._priority_order = tuple(
+                self.get('citation_priority', _DEFAULT_CONFIG['citation_priority'])
+            )
+        return self._priority_order
+    
+    @property
+    def priority_set(self) -> FrozenSet[str]:
+        """Identifier types enabled in the configuration, for membership tests."""
+        if self._priority_set is None:
+            self._priority_set = frozenset(self.priority_order)
+        return self._priority_set
+    
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
             with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            return config or self._get_default_config()
+                config = yaml.load(f, Loader=_Loader)
+            return config or _DEFAULT_CONFIG
         except FileNotFoundError:
             # Return default configuration
-            return self._get_default_config()
+            return _DEFAULT_CONFIG
     
     def _get_default_config(self) -> Dict[str, Any]:
-        """Return default configuration."""
-        return {
-            'citation_priority': [
-                'doi',
-                'pmid',
-                'pmcid',
-                'arxiv',
-                'isbn',
-                'url'
-            ],
-            'bibtex': {
-                'encoding': 'utf-8',
-                'strict_parsing': False
-            },
-            'output': {
-                'include_metadata': True,
-                'format': 'yaml'
-            }
-        }
+        """Return the shared default configuration (read-only)."""
+        return _DEFAULT_CONFIG
+    
+    def copy(self) -> Dict[str, Any]:
+        """Return a deep copy of the configuration that is safe to mutate."""
+        return copy.deepcopy(self.config)
     
     def get(self, key_path: str, default=None):
         """Get configuration value using dot notation.
@@ -61,13 +149,21 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key_path.split('.')
+        try:
+            value = self._get_cache[key_path]
+        except KeyError:
+            value = self._get_cache[key_path] = self._resolve(key_path)
+        
+        return default if value is _MISSING else value
+    
+    def _resolve(self, key_path: str):
+        """Walk the configuration for a dot-separated key path."""
         value = self.config
         
-        for key in keys:
+        for key in key_path.split('.'):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
-                return default
+                return _MISSING
         
         return value
\ No newline at end of file
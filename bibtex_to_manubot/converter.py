@@ -2,44 +2,351 @@
 BibTeX to Manubot converter.
 """
 
+import io
+import os
 import re
+import threading
 import time
+from collections import Counter
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import IO, Iterable, List, Optional, Dict, Any, Tuple, Union
 import bibtexparser
+from bibtexparser.bibdatabase import BibDatabase
 from bibtexparser.bparser import BibTexParser
 from bibtexparser.customization import convert_to_unicode
+from bibtexparser.latexenc import latex_to_unicode
+import yaml
 
 from .models import (
     BibTeXEntry, ManubotCitation, ConversionResult, 
     BatchConversionResult, CitationType
 )
-from .config import Config
+from .config import Config, get_yaml_dumper, get_yaml_loader
 from .utils import (
     extract_doi, extract_pmid, extract_pmcid, 
     extract_arxiv_id, extract_isbn, validate_url,
     clean_bibtex_field, generate_publication_date
 )
 
+# Words of a title, for duplicate detection
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# YAML emitter for the flat citation schema (str, int and list-of-str values).
+# Strings are written plain when YAML would read them back as the same string,
+# single-quoted when they only need quoting, and double-quoted with escapes
+# when they contain characters that cannot appear literally.
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_PLAIN_FIRST_CHARS = frozenset('-?:,[]{}#&*!|>\'"%@`')
+_YAML_UNSAFE_RE = re.compile('[^\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+_YAML_ESCAPE_RE = re.compile('["\\\\]|' + _YAML_UNSAFE_RE.pattern)
+_YAML_ESCAPES = {'"': '\\"', '\\': '\\\\', '\n': '\\n', '\t': '\\t', '\r': '\\r'}
+
+
+def _yaml_escape_char(match) -> str:
+    """Escape one character for a double-quoted YAML scalar."""
+    char = match.group()
+    escape = _YAML_ESCAPES.get(char)
+    if escape is not None:
+        return escape
+    code = ord(char)
+    if code < 0x100:
+        return f'\\x{code:02x}'
+    if code < 0x10000:
+        return f'\\u{code:04x}'
+    return f'\\U{code:08x}'
+
+
+def _yaml_str(value: str) -> str:
+    """Format a string as a YAML scalar that loads back unchanged."""
+    if _YAML_UNSAFE_RE.search(value):
+        return '"' + _YAML_ESCAPE_RE.sub(_yaml_escape_char, value) + '"'
+    
+    if (value and value[0] not in _PLAIN_FIRST_CHARS and value[0] != ' '
+            and value[-1] != ' ' and value[-1] != ':'
+            and ': ' not in value and ' #' not in value
+            and _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False)) == _YAML_STR_TAG):
+        return value
+    
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _emit_citation(citation: Dict[str, Any]) -> Optional[str]:
+    """Format one citation as a YAML list item.
+    
+    Args:
+        citation: Citation dictionary from ManubotCitation.to_dict
+        
+    Returns:
+        YAML text ending in a newline, or None if a value is not a string,
+        an integer or a list of strings
+    """
+    lines = []
+    for key, value in citation.items():
+        prefix = '- ' if not lines else '  '
+        if isinstance(value, str):
+            lines.append(f"{prefix}{_yaml_str(key)}: {_yaml_str(value)}")
+        elif type(value) is int:
+            lines.append(f"{prefix}{_yaml_str(key)}: {value}")
+        elif isinstance(value, list) and value and all(isinstance(item, str) for item in value):
+            lines.append(f"{prefix}{_yaml_str(key)}:")
+            lines.extend(f"  - {_yaml_str(item)}" for item in value)
+        else:
+            return None
+    
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def _iter_yaml_citations(stream: IO[str]) -> Iterable[Dict[str, Any]]:
+    """Yield the citations of a Manubot YAML stream one document at a time.
+    
+    A document may be a list of citations, the old ``citations:`` wrapper
+    around such a list, or a single citation mapping, so multi-document
+    files never need to be loaded whole.
+    
+    Args:
+        stream: Text stream of one or more YAML documents
+        
+    Returns:
+        Iterator over citation dictionaries
+    """
+    for data in yaml.load_all(stream, Loader=get_yaml_loader()):
+        # Handle both old format (with citations wrapper) and new format (direct list)
+        if isinstance(data, dict) and 'citations' in data:
+            yield from data.get('citations', [])
+        elif isinstance(data, list):
+            yield from data
+        elif isinstance(data, dict):
+            yield data
+
+
+def _checked_url(url: str) -> Optional[str]:
+    """Return the URL itself if it is a usable http(s) URL."""
+    return url if validate_url(url) else None
+
+
+# Identifier type -> (entry accessor, cleaner returning the identifier or None,
+# citation type); _extract_best_identifier walks these in priority order
+_IDENTIFIER_EXTRACTORS = {
+    'doi': (attrgetter('doi'), extract_doi, CitationType.DOI),
+    'pmid': (attrgetter('pmid'), extract_pmid, CitationType.PMID),
+    'pmcid': (attrgetter('pmcid'), extract_pmcid, CitationType.PMCID),
+    'arxiv': (attrgetter('arxiv'), extract_arxiv_id, CitationType.ARXIV),
+    'isbn': (attrgetter('isbn'), extract_isbn, CitationType.ISBN),
+    'url': (attrgetter('url'), _checked_url, CitationType.URL),
+}
+
+# Fast BibTeX scanner. It accepts the plain subset of BibTeX that DBLP and
+# most reference managers emit and produces exactly the records bibtexparser
+# would; anything else (@string, @preamble, comments, # concatenation, bare
+# macro values, parenthesised entries) makes it give up so the caller can
+# fall back to bibtexparser. Whitespace is pyparsing's: space, tab, CR, LF.
+_ENTRY_HEAD_RE = re.compile(r'[ \t\r\n]*@[ \t\r\n]*([A-Za-z]+)[ \t\r\n]*\{[ \t\r\n]*([^,\s]+)[ \t\r\n]*,')
+_FIELD_NAME_RE = re.compile(r'[ \t\r\n]*([A-Za-z0-9_\-().+]+)[ \t\r\n]*=[ \t\r\n]*')
+_NUMBER_RE = re.compile(r'[0-9]+')
+_SEPARATOR_RE = re.compile(r'[ \t\r\n]*([,}])')
+_CLOSE_RE = re.compile(r'[ \t\r\n]*\}')
+_BRACE_RE = re.compile(r'[{}]')
+_QUOTED_RE = re.compile(r'[{}"]')
+_SPECIAL_ENTRY_TYPES = frozenset(('string', 'preamble', 'comment'))
+
+
+def _scan_braced(content: str, pos: int) -> int:
+    """Return the end of the balanced ``{...}`` group at ``pos``, or -1."""
+    depth = 0
+    for match in _BRACE_RE.finditer(content, pos):
+        if match.group() == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return -1
+
+
+def _scan_quoted(content: str, pos: int) -> int:
+    """Return the end of the ``"..."`` value at ``pos`` (braces balanced), or -1."""
+    depth = 0
+    for match in _QUOTED_RE.finditer(content, pos + 1):
+        char = match.group()
+        if char == '"':
+            if depth == 0:
+                return match.end()
+        elif char == '{':
+            depth += 1
+        elif depth == 0:
+            return -1
+        else:
+            depth -= 1
+    return -1
+
+
+def _strip_after_new_lines(value: str) -> str:
+    """Strip leading whitespace from continuation lines, as bibtexparser does."""
+    lines = value.splitlines()
+    if len(lines) > 1:
+        lines = [lines[0]] + [line.lstrip() for line in lines[1:]]
+    return '\n'.join(lines)
+
+
+def _to_unicode(value: str) -> str:
+    """Apply bibtexparser's convert_to_unicode to one value, skipping plain text."""
+    if value.isascii() and '\\' not in value and '{' not in value and '}' not in value:
+        return value
+    return latex_to_unicode(value)
+
+
+def _scan_bibtex(content: str) -> Optional[List[Dict[str, str]]]:
+    """Scan plain BibTeX into bibtexparser-style records.
+    
+    Args:
+        content: BibTeX source text
+        
+    Returns:
+        Records with ``ENTRYTYPE`` and ``ID`` keys, or None if the source uses
+        anything beyond the plain subset the scanner handles
+    """
+    if content.startswith('\ufeff'):
+        content = content[1:]
+    if '\t' in content:
+        # pyparsing expands tabs before parsing, including inside values
+        content = content.expandtabs()
+    
+    records = []
+    pos = 0
+    while True:
+        head = _ENTRY_HEAD_RE.match(content, pos)
+        if head is None:
+            # Only whitespace may follow the last entry
+            return records if not content[pos:].strip(' \t\r\n') else None
+        
+        entry_type = head.group(1).lower()
+        if entry_type in _SPECIAL_ENTRY_TYPES:
+            return None
+        
+        pos = head.end()
+        pairs = []
+        while True:
+            name = _FIELD_NAME_RE.match(content, pos)
+            if name is None:
+                return None
+            
+            pos = name.end()
+            first = content[pos:pos + 1]
+            if first == '{' or first == '"':
+                value_end = _scan_braced(content, pos) if first == '{' else _scan_quoted(content, pos)
+                if value_end < 0:
+                    return None
+                value = content[pos + 1:value_end - 1]
+            else:
+                number = _NUMBER_RE.match(content, pos)
+                if number is None:
+                    return None
+                value_end = number.end()
+                value = number.group()
+            
+            separator = _SEPARATOR_RE.match(content, value_end)
+            if separator is None:
+                return None
+            
+            pairs.append((name.group(1), _strip_after_new_lines(value)))
+            pos = separator.end()
+            if separator.group(1) == '}':
+                break
+            
+            # Trailing comma before the closing brace
+            close = _CLOSE_RE.match(content, pos)
+            if close is not None:
+                pos = close.end()
+                break
+        
+        # Same precedence and key order as bibtexparser: the first occurrence
+        # of a field wins, field names are lowercased
+        record = {}
+        for key, value in {key: value for key, value in reversed(pairs)}.items():
+            record[key.lower()] = '' if not value or value == '{}' else value
+        record['ENTRYTYPE'] = entry_type
+        record['ID'] = head.group(2)
+        
+        records.append({key: _to_unicode(value) for key, value in record.items()})
+
+
+# bibtexparser builds its pyparsing grammar in the constructor, so each
+# thread keeps one parser and only its database is replaced per parse
+_parser_local = threading.local()
+
+
+def _fallback_parser() -> BibTexParser:
+    """Return this thread's bibtexparser parser, reset for a new parse."""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = BibTexParser(common_strings=True)
+        parser.customization = convert_to_unicode
+        parser.ignore_nonstandard_types = False
+        parser.expect_multiple_parse = True
+        _parser_local.parser = parser
+    
+    # A parser appends to its database, so start each parse with a fresh one
+    parser.bib_database = BibDatabase()
+    parser.bib_database.load_common_strings()
+    return parser
+
+
+# Converter owned by each worker process of a parallel batch
+_worker_converter = None
+
+# Entries sent to a worker process per task
+_WORKER_CHUNK_SIZE = 256
+
+
+def _init_worker(config_path: Optional[str]):
+    """Create the converter used by this worker process."""
+    global _worker_converter
+    _worker_converter = BibTeXConverter(config_path, in_worker=True)
+
+
+def _convert_chunk(records: List[Tuple[str, str, Dict[str, str]]]) -> List[ConversionResult]:
+    """Convert a chunk of (key, entry_type, fields) records in a worker.
+    
+    Entries travel as plain tuples, which pickle more cheaply than models,
+    and are rebuilt on the worker side.
+    """
+    convert_entry = _worker_converter.convert_entry
+    return [
+        convert_entry(BibTeXEntry(key=key, entry_type=entry_type, fields=fields))
+        for key, entry_type, fields in records
+    ]
+
 
 class BibTeXConverter:
     """Main class for converting BibTeX entries to Manubot format."""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, in_worker: bool = False):
         """Initialize the converter.
         
         Args:
             config_path: Path to configuration file
+            in_worker: True when running inside a worker process; entries are
+                then always converted in-process so pools are never nested
         """
         self.config = Config(config_path)
-        self.citation_priority = self.config.get('citation_priority', [
-            'doi', 'pmid', 'pmcid', 'arxiv', 'isbn', 'url'
-        ])
+        self.in_worker = in_worker
+        self.citation_priority = self.config.priority_order
+        self._extractor_chain = [
+            _IDENTIFIER_EXTRACTORS[name] for name in self.citation_priority
+            if name in _IDENTIFIER_EXTRACTORS
+        ]
+    
+    def _new_parser(self) -> BibTexParser:
+        """Return a BibTeX parser ready for one parse.
         
-        # Initialize BibTeX parser
-        self.parser = BibTexParser()
-        self.parser.customization = convert_to_unicode
-        self.parser.ignore_nonstandard_types = False
+        bibtexparser parsers keep the entries of every string they have parsed,
+        so the parser is per thread and its database is emptied each time.
+        """
+        return _fallback_parser()
     
     def parse_bibtex_file(self, file_path: Union[str, Path]) -> List[BibTeXEntry]:
         """Parse a BibTeX file and return entries.
@@ -50,31 +357,66 @@ class BibTeXConverter:
         Returns:
             List of parsed BibTeX entries
         """
-        file_path = Path(file_path)
+        file_path = os.fspath(file_path)
         encoding = self.config.get('bibtex.encoding', 'utf-8')
         
         try:
             with open(file_path, 'r', encoding=encoding) as bibtex_file:
                 content = bibtex_file.read()
-                
-            # Parse BibTeX content
-            bib_database = bibtexparser.loads(content, parser=self.parser)
-            
-            # Convert to our BibTeXEntry models
-            entries = []
-            for entry in bib_database.entries:
-                bibtex_entry = BibTeXEntry(
-                    key=entry.get('ID', ''),
-                    entry_type=entry.get('ENTRYTYPE', 'misc').lower(),
-                    fields=entry
-                )
-                entries.append(bibtex_entry)
             
-            return entries
+            return self._parse_bibtex_content(content)
             
         except Exception as e:
             raise ValueError(f"Error parsing BibTeX file {file_path}: {str(e)}")
     
+    def parse_bibtex_stream(self, stream: IO, name: str = '<stream>') -> List[BibTeXEntry]:
+        """Parse BibTeX from an open file object and return entries.
+        
+        Binary streams are decoded with the configured encoding, so callers can
+        pass files opened with an explicit buffer size.
+        
+        Args:
+            stream: Binary or text file object positioned at the BibTeX data
+            name: Name used in error messages
+            
+        Returns:
+            List of parsed BibTeX entries
+        """
+        encoding = self.config.get('bibtex.encoding', 'utf-8')
+        
+        try:
+            if isinstance(stream, io.TextIOBase):
+                content = stream.read()
+            else:
+                reader = io.TextIOWrapper(stream, encoding=encoding)
+                try:
+                    content = reader.read()
+                finally:
+                    # Leave the caller's stream open
+                    reader.detach()
+            
+            return self._parse_bibtex_content(content)
+            
+        except Exception as e:
+            raise ValueError(f"Error parsing BibTeX file {name}: {str(e)}")
+    
+    def _parse_bibtex_content(self, content: str) -> List[BibTeXEntry]:
+        """Parse BibTeX source text into our BibTeXEntry models."""
+        records = _scan_bibtex(content)
+        if records is None:
+            records = bibtexparser.loads(content, parser=self._new_parser()).entries
+        
+        entries = []
+        for entry in records:
+            bibtex_entry = BibTeXEntry(
+                key=entry.get('ID', ''),
+                entry_type=entry.get('ENTRYTYPE', 'misc').lower(),
+                fields=entry
+            )
+            entries.append(bibtex_entry)
+        
+        return entries
+    
     def convert_entry(self, entry: BibTeXEntry) -> ConversionResult:
         """Convert a single BibTeX entry to Manubot format.
         
@@ -94,36 +436,36 @@ class BibTeXConverter:
                 result.errors.append("No valid identifier found")
                 return result
             
+            # Read each entry attribute once
+            title, authors, year = entry.title, entry.authors, entry.year
+            journal, booktitle, publisher = entry.journal, entry.booktitle, entry.publisher
+            
             # Create Manubot citation
             manubot_id = f"{citation_type.value}:{identifier}"
             
             # Generate publication date
-            publication_date = generate_publication_date(
-                entry.year, 
-                getattr(entry, 'month', None), 
-                getattr(entry, 'day', None)
-            )
+            publication_date = generate_publication_date(year, entry.month, entry.day)
             
             # Use journal field, or fall back to booktitle for conference papers
             journal_or_conference = None
-            if entry.journal:
-                journal_or_conference = clean_bibtex_field(entry.journal)
-            elif entry.booktitle:
-                journal_or_conference = clean_bibtex_field(entry.booktitle)
+            if journal:
+                journal_or_conference = clean_bibtex_field(journal)
+            elif booktitle:
+                journal_or_conference = clean_bibtex_field(booktitle)
                 
             manubot_citation = ManubotCitation(
                 id=manubot_id,
                 citation_type=citation_type,
                 identifier=identifier,
-                title=clean_bibtex_field(entry.title) if entry.title else None,
-                authors=entry.authors,
+                title=clean_bibtex_field(title) if title else None,
+                authors=authors,
                 journal=journal_or_conference,
-                year=entry.year,
+                year=year,
                 date=publication_date,
                 volume=entry.volume,
                 issue=entry.number,  # BibTeX "number" maps to "issue"
                 pages=entry.pages,
-                publisher=clean_bibtex_field(entry.publisher) if entry.publisher else None,
+                publisher=clean_bibtex_field(publisher) if publisher else None,
                 link=entry.url,
                 original_key=entry.key,
                 bibtex_type=entry.entry_type
@@ -133,11 +475,11 @@ class BibTeXConverter:
             result.manubot_citation = manubot_citation
             
             # Add warnings for missing important fields
-            if not entry.title:
+            if not title:
                 result.warnings.append("No title found")
-            if not entry.authors:
+            if not authors:
                 result.warnings.append("No authors found")
-            if not entry.year:
+            if not year:
                 result.warnings.append("No publication year found")
         
         except Exception as e:
@@ -154,23 +496,18 @@ class BibTeXConverter:
         Returns:
             True if this is an arXiv paper, False otherwise
         """
-        # Check if journal contains "arXiv"
-        if entry.journal and 'arxiv' in entry.journal.lower():
+        # An arXiv eprint identifier is enough on its own
+        if getattr(entry, 'eprint', None):
             return True
-            
-        # Check if eprint field contains arXiv identifier
-        if hasattr(entry, 'eprint') and entry.eprint:
-            return True
-            
-        # Check if url contains arxiv.org
-        if entry.url and 'arxiv.org' in entry.url.lower():
-            return True
-            
-        # Check if DOI is an arXiv DOI
-        if entry.doi and 'arxiv' in entry.doi.lower():
+        
+        # Journal or DOI mentioning arXiv, lowercased together in one pass
+        # ('|' never occurs in "arxiv", so the join cannot create a match)
+        if 'arxiv' in f"{entry.journal or ''}|{entry.doi or ''}".lower():
             return True
-            
-        return False
+        
+        # URL pointing at arxiv.org
+        url = entry.url
+        return bool(url) and 'arxiv.org' in url.lower()
     
     def _extract_best_identifier(self, entry: BibTeXEntry) -> tuple[Optional[CitationType], Optional[str]]:
         """Extract the best available identifier from a BibTeX entry.
@@ -182,35 +519,12 @@ class BibTeXConverter:
             Tuple of (citation_type, identifier) or (None, None)
         """
         # Check each identifier type in priority order
-        for identifier_type in self.citation_priority:
-            if identifier_type == 'doi' and entry.doi:
-                clean_doi = extract_doi(entry.doi)
-                if clean_doi:
-                    return CitationType.DOI, clean_doi
-            
-            elif identifier_type == 'pmid' and entry.pmid:
-                clean_pmid = extract_pmid(entry.pmid)
-                if clean_pmid:
-                    return CitationType.PMID, clean_pmid
-            
-            elif identifier_type == 'pmcid' and entry.pmcid:
-                clean_pmcid = extract_pmcid(entry.pmcid)
-                if clean_pmcid:
-                    return CitationType.PMCID, clean_pmcid
-            
-            elif identifier_type == 'arxiv' and entry.arxiv:
-                clean_arxiv = extract_arxiv_id(entry.arxiv)
-                if clean_arxiv:
-                    return CitationType.ARXIV, clean_arxiv
-            
-            elif identifier_type == 'isbn' and entry.isbn:
-                clean_isbn = extract_isbn(entry.isbn)
-                if clean_isbn:
-                    return CitationType.ISBN, clean_isbn
-            
-            elif identifier_type == 'url' and entry.url:
-                if validate_url(entry.url):
-                    return CitationType.URL, entry.url
+        for get_value, clean, citation_type in self._extractor_chain:
+            value = get_value(entry)
+            if value:
+                identifier = clean(value)
+                if identifier:
+                    return citation_type, identifier
         
         # Fallback: use BibTeX key as raw citation
         if entry.key:
@@ -244,32 +558,82 @@ class BibTeXConverter:
         """
         start_time = time.time()
         
-        # Parse all input files
-        all_entries = []
-        file_paths = [str(p) for p in input_paths]
-        
-        for file_path in input_paths:
-            try:
-                entries = self.parse_bibtex_file(file_path)
-                all_entries.extend(entries)
-            except Exception as e:
-                # Create failed results for unparseable files
-                failed_result = ConversionResult(
-                    original_key=f"FILE:{file_path}",
-                    success=False,
-                    errors=[f"Failed to parse file: {str(e)}"]
-                )
-                all_entries.append(failed_result)
-        
-        # Convert entries
-        conversion_results = []
-        for entry in all_entries:
-            if isinstance(entry, BibTeXEntry):
-                result = self.convert_entry(entry)
-                conversion_results.append(result)
+        # Parse all input files, overlapping one file's reads with another's parsing
+        file_paths = list(map(os.fspath, input_paths))
+        
+        if len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                parsed = list(executor.map(
+                    lambda file_path: self._parse_source(self.parse_bibtex_file, file_path),
+                    file_paths
+                ))
+        else:
+            parsed = [self._parse_source(self.parse_bibtex_file, file_path) for file_path in file_paths]
+        
+        return self._finish_batch(file_paths, parsed, start_time, output_path)
+    
+    def batch_convert_streams(self, streams: Iterable[IO], 
+                              output_path: Optional[Union[str, Path]] = None) -> BatchConversionResult:
+        """Convert BibTeX from open file objects to a single Manubot YAML file.
+        
+        Streams are consumed one at a time, so ``streams`` may be a generator
+        that opens (and closes) each file lazily.
+        
+        Args:
+            streams: Iterable of binary or text file objects
+            output_path: Path for output YAML file (optional)
+            
+        Returns:
+            Batch conversion result
+        """
+        start_time = time.time()
+        
+        parsed = []
+        file_paths = []
+        
+        for stream in streams:
+            name = str(getattr(stream, 'name', '<stream>'))
+            file_paths.append(name)
+            parsed.append(self._parse_source(self.parse_bibtex_stream, stream, name))
+        
+        return self._finish_batch(file_paths, parsed, start_time, output_path)
+    
+    def _parse_source(self, parse, source, *args) -> Tuple[List[BibTeXEntry], Optional[ConversionResult]]:
+        """Parse one input, turning a parse failure into a failed result.
+        
+        Returns:
+            Tuple of (entries, None) on success or ([], failed result)
+        """
+        try:
+            return parse(source, *args), None
+        except Exception as e:
+            # Create failed results for unparseable files
+            name = args[0] if args else source
+            failed_result = ConversionResult(
+                original_key=f"FILE:{name}",
+                success=False,
+                errors=[f"Failed to parse file: {str(e)}"]
+            )
+            return [], failed_result
+    
+    def _finish_batch(self, file_paths: List[str], 
+                      parsed: List[Tuple[List[BibTeXEntry], Optional[ConversionResult]]],
+                      start_time: float,
+                      output_path: Optional[Union[str, Path]]) -> BatchConversionResult:
+        """Convert parsed entries, build the batch result and save it."""
+        # Gather every file's entries, noting where failed files belong
+        entries = []
+        failures = []
+        for file_entries, failure in parsed:
+            if failure is None:
+                entries.extend(file_entries)
             else:
-                # Already a failed ConversionResult
-                conversion_results.append(entry)
+                failures.append((len(entries) + len(failures), failure))
+        
+        # Convert entries, then put failed file results back in their place
+        conversion_results = self._convert_entries(entries)
+        for position, failure in failures:
+            conversion_results.insert(position, failure)
         
         # Calculate statistics
         successful = sum(1 for r in conversion_results if r.success)
@@ -291,6 +655,43 @@ class BibTeXConverter:
         
         return batch_result
     
+    def _convert_entries(self, entries: List[BibTeXEntry]) -> List[ConversionResult]:
+        """Convert entries in order, across worker processes for large batches.
+        
+        Batches smaller than ``conversion.parallel_threshold`` are converted
+        in this process, where starting workers would cost more than it saves,
+        and so is every batch of a converter created with ``in_worker=True``.
+        
+        Args:
+            entries: Parsed BibTeX entries
+            
+        Returns:
+            Conversion results in the same order as ``entries``
+        """
+        max_workers = self.config.get('conversion.max_workers') or os.cpu_count() or 1
+        threshold = self.config.get('conversion.parallel_threshold', 2000)
+        
+        if self.in_worker or max_workers < 2 or len(entries) < threshold:
+            return [self.convert_entry(entry) for entry in entries]
+        
+        # Read-only mappings such as MappingProxyType cannot be pickled
+        records = [
+            (entry.key, entry.entry_type,
+             entry.fields if type(entry.fields) is dict else dict(entry.fields))
+            for entry in entries
+        ]
+        chunks = [
+            records[start:start + _WORKER_CHUNK_SIZE]
+            for start in range(0, len(records), _WORKER_CHUNK_SIZE)
+        ]
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(self.config.config_path,)) as executor:
+            for chunk_results in executor.map(_convert_chunk, chunks):
+                results.extend(chunk_results)
+        return results
+    
     def _find_title_overlap(self, title1: str, title2: str, min_words: int = 6) -> int:
         """Find the longest consecutive word overlap between two titles.
         
@@ -306,38 +707,79 @@ class BibTeXConverter:
             return 0
             
         # Normalize titles: lowercase, remove punctuation, split into words
-        import re
-        words1 = re.findall(r'\b\w+\b', title1.lower())
-        words2 = re.findall(r'\b\w+\b', title2.lower())
+        words1 = _WORD_RE.findall(title1.lower())
+        words2 = _WORD_RE.findall(title2.lower())
         
+        # Longest common run of words by dynamic programming: run[j] is the
+        # length of the common run ending at words1[i] and words2[j]
         max_overlap = 0
-        
-        # Find longest consecutive overlap
-        for i in range(len(words1)):
-            for j in range(len(words2)):
-                overlap = 0
-                while (i + overlap < len(words1) and 
-                       j + overlap < len(words2) and 
-                       words1[i + overlap] == words2[j + overlap]):
-                    overlap += 1
-                max_overlap = max(max_overlap, overlap)
+        previous = [0] * (len(words2) + 1)
+        for word1 in words1:
+            current = [0]
+            for j, word2 in enumerate(words2):
+                if word1 == word2:
+                    run = previous[j] + 1
+                    if run > max_overlap:
+                        max_overlap = run
+                    current.append(run)
+                else:
+                    current.append(0)
+            previous = current
                 
         return max_overlap
     
-    def _remove_arxiv_duplicates(self, citations: List[Dict], min_overlap: int = 6) -> List[Dict]:
+    def _title_shingles(self, title: str, size: int, word_ids: Dict[str, int]) -> frozenset:
+        """Return the set of ``size``-word runs in a title.
+        
+        Words are mapped to small ints through ``word_ids`` so that each run
+        is a tuple of ints, which hashes and compares cheaply.
+        
+        Args:
+            title: Citation title
+            size: Number of consecutive words per run
+            word_ids: Shared word -> int table, extended as needed
+            
+        Returns:
+            Frozen set of word-id tuples
+        """
+        ids = [word_ids.setdefault(word, len(word_ids)) for word in _WORD_RE.findall(title.lower())]
+        return frozenset(zip(*(ids[k:] for k in range(size))))
+    
+    def _remove_arxiv_duplicates(self, citations: List[Dict], min_overlap: int = 6,
+                                 verbose: bool = True) -> List[Dict]:
         """Remove arXiv papers that have published versions with similar titles.
         
+        Two titles overlap by at least ``min_overlap`` consecutive words exactly
+        when they share a ``min_overlap``-word run, so the published titles are
+        indexed by their runs once and each arXiv title is matched by lookup
+        rather than compared against every published title.
+        
         Args:
             citations: List of citation dictionaries
             min_overlap: Minimum consecutive word overlap to consider as duplicate
+            verbose: Print each duplicate that is removed
             
         Returns:
             Filtered list with arXiv duplicates removed
         """
         # Separate arXiv and non-arXiv papers based on publisher field (renamed from journal)
         # ArXiv papers have publisher = "CoRR" (Computing Research Repository)
-        arxiv_papers = [c for c in citations if c.get('publisher') == 'CoRR']
-        non_arxiv_papers = [c for c in citations if c.get('publisher') != 'CoRR']
+        arxiv_papers = []
+        non_arxiv_papers = []
+        for citation in citations:
+            (arxiv_papers if citation.get('publisher') == 'CoRR' else non_arxiv_papers).append(citation)
+        
+        # Nothing can be a duplicate unless both kinds of paper are present
+        if not arxiv_papers or not non_arxiv_papers:
+            return list(citations)
+        
+        # Map each word run to the first published paper containing it
+        word_ids: Dict[str, int] = {}
+        run_index: Dict[tuple, int] = {}
+        for position, paper in enumerate(non_arxiv_papers):
+            if paper.get('title'):
+                for shingle in self._title_shingles(paper['title'], min_overlap, word_ids):
+                    run_index.setdefault(shingle, position)
         
         # Find arXiv papers to remove
         arxiv_to_remove = set()
@@ -346,24 +788,63 @@ class BibTeXConverter:
             arxiv_title = arxiv_paper.get('title', '')
             if not arxiv_title:
                 continue
-                
-            for non_arxiv_paper in non_arxiv_papers:
-                non_arxiv_title = non_arxiv_paper.get('title', '')
-                if not non_arxiv_title:
-                    continue
-                    
-                overlap = self._find_title_overlap(arxiv_title, non_arxiv_title)
-                if overlap >= min_overlap:
+            
+            matches = [
+                run_index[shingle]
+                for shingle in self._title_shingles(arxiv_title, min_overlap, word_ids)
+                if shingle in run_index
+            ]
+            if matches:
+                non_arxiv_title = non_arxiv_papers[min(matches)]['title']
+                if verbose:
+                    overlap = self._find_title_overlap(arxiv_title, non_arxiv_title)
                     print(f"  Removing arXiv duplicate: {arxiv_paper.get('id')}")
                     print(f"    ArXiv title (CoRR): {arxiv_title}")
                     print(f"    Published title: {non_arxiv_title}")
                     print(f"    Overlap: {overlap} words")
-                    arxiv_to_remove.add(arxiv_paper.get('id'))
-                    break
+                arxiv_to_remove.add(arxiv_paper.get('id'))
         
         # Return filtered list
         return [c for c in citations if c.get('id') not in arxiv_to_remove]
 
+    def _sort_citations(self, citations: List[Dict]):
+        """Sort citation dictionaries in place in output order."""
+        # Sort by year (newest first), then by title for same years. The keys
+        # are built once as plain tuples so Timsort only compares tuples; the
+        # index keeps the sort stable and never compares the dicts themselves.
+        keyed = [
+            (-(citation.get('year') or 0), (citation.get('title') or '').lower(), i)
+            for i, citation in enumerate(citations)
+        ]
+        keyed.sort()
+        citations[:] = [citations[i] for _, _, i in keyed]
+    
+    def _output_citations(self, citations: Iterable[ManubotCitation],
+                          verbose: bool = True) -> List[Dict[str, Any]]:
+        """Build the citation dictionaries save_yaml writes, in file order.
+        
+        Args:
+            citations: Successfully converted citations
+            verbose: Report the arXiv duplicates that are removed
+            
+        Returns:
+            Citation dictionaries without arXiv duplicates, sorted for output
+        """
+        include_metadata = self.config.get('output.include_metadata', True)
+        output = [citation.to_dict(include_metadata) for citation in citations]
+        
+        # Remove arXiv duplicates
+        if verbose:
+            print("Checking for arXiv duplicates...")
+        original_count = len(output)
+        output = self._remove_arxiv_duplicates(output, verbose=verbose)
+        removed_count = original_count - len(output)
+        if verbose and removed_count > 0:
+            print(f"Removed {removed_count} arXiv duplicates")
+        
+        self._sort_citations(output)
+        return output
+    
     def save_yaml(self, batch_result: BatchConversionResult, 
                   output_path: Union[str, Path]):
         """Save conversion results to YAML file.
@@ -372,50 +853,22 @@ class BibTeXConverter:
             batch_result: Batch conversion result
             output_path: Output file path
         """
-        import yaml
-        
         output_path = Path(output_path)
-        include_metadata = self.config.get('output.include_metadata', True)
-        
-        # Get successful citations
-        successful_citations = []
-        for result in batch_result.conversions:
-            if result.success and result.manubot_citation:
-                citation_dict = result.manubot_citation.to_dict(include_metadata)
-                successful_citations.append(citation_dict)
-        
-        # Remove arXiv duplicates
-        print("Checking for arXiv duplicates...")
-        original_count = len(successful_citations)
-        successful_citations = self._remove_arxiv_duplicates(successful_citations)
-        removed_count = original_count - len(successful_citations)
-        if removed_count > 0:
-            print(f"Removed {removed_count} arXiv duplicates")
+        dumper = get_yaml_dumper(self.config.get('output.yaml_dumper', 'c'))
+        successful_citations = self._output_citations(batch_result.get_successful_citations())
+        
+        # Format each citation as a list item, leaving values outside the
+        # known schema to PyYAML, and separate the items with a blank line
+        items = []
+        for citation in successful_citations:
+            item = _emit_citation(citation)
+            if item is None:
+                item = yaml.dump([citation], Dumper=dumper, default_flow_style=False,
+                                 allow_unicode=True, sort_keys=False, indent=2)
+            items.append(item)
         
-        # Sort by year (newest first), then by title for same years
-        successful_citations.sort(key=lambda x: (
-            -(x.get('year', 0) or 0),  # Negative for descending order, handle None
-            x.get('title', '').lower()  # Secondary sort by title
-        ))
-        
-        # Write YAML file as a proper list with line breaks between entries
         with open(output_path, 'w', encoding='utf-8') as f:
-            for i, citation in enumerate(successful_citations):
-                if i > 0:
-                    f.write('\n')  # Add line break between entries
-                
-                # Write each citation as a list item with proper indentation
-                yaml_str = yaml.dump(citation, default_flow_style=False, 
-                                   allow_unicode=True, sort_keys=False, indent=2)
-                # Remove the '...' document separator that yaml.dump adds
-                yaml_str = yaml_str.rstrip('\n...\n').rstrip('\n')
-                
-                # Add the list item indicator and proper indentation
-                lines = yaml_str.split('\n')
-                if lines:
-                    f.write(f"- {lines[0]}\n")  # First line with list indicator
-                    for line in lines[1:]:
-                        f.write(f"  {line}\n")  # Indent remaining lines by 2 spaces
+            f.write('\n'.join(items))
     
     def validate_manubot_format(self, yaml_path: Union[str, Path]) -> Dict[str, Any]:
         """Validate generated YAML against Manubot format requirements.
@@ -426,62 +879,83 @@ class BibTeXConverter:
         Returns:
             Validation results dictionary
         """
-        import yaml
-        
         yaml_path = Path(yaml_path)
-        validation_result = {
-            'valid': True,
-            'errors': [],
-            'warnings': [],
-            'citation_count': 0,
-            'citation_types': {}
-        }
+        validation_result = self._new_validation_result()
         
         try:
             with open(yaml_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
-            # Handle both old format (with citations wrapper) and new format (direct list)
-            if isinstance(data, dict) and 'citations' in data:
-                citations = data.get('citations', [])
-            elif isinstance(data, list):
-                citations = data
-            else:
-                citations = []
-            
-            validation_result['citation_count'] = len(citations)
-            
-            for i, citation in enumerate(citations):
-                citation_id = citation.get('id', '')
-                citation_type = citation.get('type', '')
-                
-                # Count citation types
-                if citation_type:
-                    validation_result['citation_types'][citation_type] = \
-                        validation_result['citation_types'].get(citation_type, 0) + 1
-                
-                # Validate required fields
-                if not citation_id:
-                    validation_result['errors'].append(f"Citation {i+1}: Missing 'id' field")
-                    validation_result['valid'] = False
-                elif ':' not in citation_id:
-                    validation_result['errors'].append(f"Citation {i+1}: Invalid ID format '{citation_id}'")
-                    validation_result['valid'] = False
-                
-                if not citation_type:
-                    validation_result['errors'].append(f"Citation {i+1}: Missing 'type' field")
-                    validation_result['valid'] = False
-                
-                # Check for recommended fields
-                if not citation.get('title'):
-                    validation_result['warnings'].append(f"Citation {i+1}: Missing title")
-                if not citation.get('authors'):
-                    validation_result['warnings'].append(f"Citation {i+1}: Missing authors")
-                if not citation.get('year'):
-                    validation_result['warnings'].append(f"Citation {i+1}: Missing year")
+                self._check_citations(_iter_yaml_citations(f), validation_result)
         
         except Exception as e:
             validation_result['valid'] = False
             validation_result['errors'].append(f"YAML parsing error: {str(e)}")
         
-        return validation_result
\ No newline at end of file
+        return validation_result
+    
+    def validate_citations(self, conversions: List[ConversionResult]) -> Dict[str, Any]:
+        """Validate conversion results in memory against Manubot format requirements.
+        
+        Runs the same checks as validate_manubot_format on exactly the
+        citations save_yaml writes (arXiv duplicates removed, in file order)
+        without re-reading the YAML file.
+        
+        Args:
+            conversions: Conversion results, e.g. ``BatchConversionResult.conversions``
+            
+        Returns:
+            Validation results dictionary
+        """
+        citations = self._output_citations(
+            (result.manubot_citation for result in conversions
+             if result.success and result.manubot_citation),
+            verbose=False
+        )
+        
+        validation_result = self._new_validation_result()
+        self._check_citations(citations, validation_result)
+        
+        return validation_result
+    
+    def _new_validation_result(self) -> Dict[str, Any]:
+        """Return an empty validation results dictionary."""
+        return {
+            'valid': True,
+            'errors': [],
+            'warnings': [],
+            'citation_count': 0,
+            'citation_types': Counter()
+        }
+    
+    def _check_citations(self, citations: Iterable[Dict[str, Any]], 
+                         validation_result: Dict[str, Any]):
+        """Check citation dictionaries and record findings in validation_result."""
+        citation_types = validation_result['citation_types']
+        
+        for i, citation in enumerate(citations):
+            validation_result['citation_count'] += 1
+            citation_id = citation.get('id', '')
+            citation_type = citation.get('type', '')
+            
+            # Count citation types
+            if citation_type:
+                citation_types[citation_type] += 1
+            
+            # Validate required fields
+            if not citation_id:
+                validation_result['errors'].append(f"Citation {i+1}: Missing 'id' field")
+                validation_result['valid'] = False
+            elif ':' not in citation_id:
+                validation_result['errors'].append(f"Citation {i+1}: Invalid ID format '{citation_id}'")
+                validation_result['valid'] = False
+            
+            if not citation_type:
+                validation_result['errors'].append(f"Citation {i+1}: Missing 'type' field")
+                validation_result['valid'] = False
+            
+            # Check for recommended fields
+            if not citation.get('title'):
+                validation_result['warnings'].append(f"Citation {i+1}: Missing title")
+            if not citation.get('authors'):
+                validation_result['warnings'].append(f"Citation {i+1}: Missing authors")
+            if not citation.get('year'):
+                validation_result['warnings'].append(f"Citation {i+1}: Missing year")
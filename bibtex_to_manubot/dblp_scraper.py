@@ -2,15 +2,55 @@
 DBLP Profile Scraper - Extract BibTeX data from DBLP profile URLs.
 """
 
+import io
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, urlparse
 import re
 from typing import Optional, List, Dict, Tuple
 import time
-from pathlib import Path
+from functools import lru_cache
+import os
 import tempfile
 
+from .utils import is_dblp_host_url
+
+
+# Prefer lxml's C parser for BeautifulSoup; html.parser is pure Python
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Chunk size for streamed BibTeX downloads
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# /pid/154/4313.html or /pid/154/4313 -> 154/4313
+_PID_RE = re.compile(r'/pid/([^/]+/[^/.]+)')
+# Profile path without an extension, e.g. /pid/154/4313
+_PID_TAIL_RE = re.compile(r'/pid/[^/]+/[^/]+$')
+# Start of a BibTeX entry anywhere, and at the start of a line
+_ENTRY_RE = re.compile(r'@\w+\s*\{')
+_ENTRY_COUNT_RE = re.compile(r'^@\w+\s*\{', re.MULTILINE)
+# BibTeX publication markers in a profile page's raw bytes
+_PUB_RE = re.compile(rb'@(?:article|inproceedings|book)\b')
+
+
+def _is_profile_url(parsed) -> bool:
+    """Check whether a parsed URL points at a DBLP person profile."""
+    return (parsed.netloc == 'dblp.org' or parsed.netloc == 'dblp.uni-trier.de') and '/pid/' in parsed.path
+
+
+@lru_cache(maxsize=256)
+def _extract_pid(url: str) -> Optional[str]:
+    """Extract the person ID from a DBLP URL (cached, pure URL parsing)."""
+    # Match patterns like /pid/154/4313.html or /pid/154/4313
+    match = _PID_RE.search(url)
+    return match.group(1) if match else None
+
 
 class DBLPScraper:
     """Scraper for DBLP (Database Systems and Logic Programming) profiles."""
@@ -26,6 +66,15 @@ class DBLPScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (BibTeX-to-Manubot Converter; Academic Research Tool)'
         })
+        
+        # Keep connections alive across profiles and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def is_dblp_url(self, url: str) -> bool:
         """Check if URL is a valid DBLP profile URL.
@@ -36,8 +85,7 @@ class DBLPScraper:
         Returns:
             True if valid DBLP profile URL
         """
-        parsed = urlparse(url)
-        return (parsed.netloc == 'dblp.org' or parsed.netloc == 'dblp.uni-trier.de') and '/pid/' in parsed.path
+        return _is_profile_url(urlparse(url))
     
     def extract_pid_from_url(self, url: str) -> Optional[str]:
         """Extract person ID (PID) from DBLP profile URL.
@@ -48,9 +96,7 @@ class DBLPScraper:
         Returns:
             Person ID or None if not found
         """
-        # Match patterns like /pid/154/4313.html or /pid/154/4313
-        match = re.search(r'/pid/([^/]+/[^/.]+)', url)
-        return match.group(1) if match else None
+        return _extract_pid(url)
     
     def get_bibtex_download_url(self, profile_url: str) -> Optional[str]:
         """Get BibTeX download URL from DBLP profile page.
@@ -75,7 +121,7 @@ class DBLPScraper:
             response = self.session.get(profile_url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, _HTML_PARSER)
             
             # Look for BibTeX download link
             for link in soup.find_all('a', href=True):
@@ -106,25 +152,33 @@ class DBLPScraper:
             if self.delay > 0:
                 time.sleep(self.delay)
             
-            response = self.session.get(bibtex_url, timeout=30)
-            response.raise_for_status()
+            # Stream the body, decoding chunk by chunk, so the raw bytes of a
+            # large profile are never held alongside the decoded text
+            buffer = io.StringIO()
+            with self.session.get(bibtex_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
+                
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE, decode_unicode=True):
+                    buffer.write(chunk)
             
             # Get content
-            content = response.text.strip()
+            content = buffer.getvalue().strip()
             if not content:
                 raise ValueError("Downloaded content is empty")
             
             # Check if response contains BibTeX content
             # Look for @article, @inproceedings, etc. anywhere in content
-            if not re.search(r'@\w+\s*\{', content):
+            if not _ENTRY_RE.search(content):
                 # If it's HTML, try to extract BibTeX from it
                 if content.lower().startswith('<!doctype html') or content.lower().startswith('<html'):
-                    soup = BeautifulSoup(content, 'html.parser')
+                    soup = BeautifulSoup(content, _HTML_PARSER)
                     
                     # Look for BibTeX content in <pre> or <code> tags
                     for tag in soup.find_all(['pre', 'code']):
                         tag_content = tag.get_text().strip()
-                        if re.search(r'@\w+\s*\{', tag_content):
+                        if _ENTRY_RE.search(tag_content):
                             content = tag_content
                             break
                     else:
@@ -159,7 +213,7 @@ class DBLPScraper:
         bibtex_content = self.download_bibtex(bibtex_url)
         
         # Count entries for user feedback
-        entry_count = len(re.findall(r'^@\w+\s*{', bibtex_content, re.MULTILINE))
+        entry_count = sum(1 for _ in _ENTRY_COUNT_RE.finditer(bibtex_content))
         print(f"Downloaded {entry_count} BibTeX entries")
         
         return bibtex_content
@@ -178,17 +232,16 @@ class DBLPScraper:
         
         # Create output file
         if output_path is None:
-            # Create temporary file
-            temp_dir = Path(tempfile.gettempdir())
+            # Create a unique temporary file; the caller owns its removal
             pid = self.extract_pid_from_url(profile_url)
-            if pid:
-                filename = f"dblp_{pid.replace('/', '_')}.bib"
-            else:
-                filename = "dblp_profile.bib"
-            output_path = str(temp_dir / filename)
+            prefix = f"dblp_{pid.replace('/', '_')}_" if pid else "dblp_profile_"
+            fd, output_path = tempfile.mkstemp(suffix='.bib', prefix=prefix)
+            f = os.fdopen(fd, 'w', encoding='utf-8')
+        else:
+            f = open(output_path, 'w', encoding='utf-8')
         
         # Write BibTeX content to file
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with f:
             f.write(bibtex_content)
         
         print(f"BibTeX saved to: {output_path}")
@@ -207,7 +260,8 @@ class DBLPScraper:
             response = self.session.get(profile_url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Only the <title> element is needed, so build no other tree nodes
+            soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=SoupStrainer('title'))
             
             info = {
                 'url': profile_url,
@@ -225,9 +279,8 @@ class DBLPScraper:
                 if ' - ' in title:
                     info['name'] = title.split(' - ')[0].strip()
             
-            # Count publications (approximate from @inproceedings, @article tags in page)
-            pub_indicators = soup.find_all(string=re.compile(r'@(article|inproceedings|book)'))
-            info['publication_count'] = len(pub_indicators)
+            # Count publications (approximate from @inproceedings, @article markers in page)
+            info['publication_count'] = sum(1 for _ in _PUB_RE.finditer(response.content))
             
             return info
             
@@ -242,35 +295,43 @@ class DBLPScraper:
             }
 
 
-def validate_dblp_url(url: str) -> Tuple[bool, str]:
-    """Validate and normalize DBLP profile URL.
+def parse_dblp_url(url: str) -> Tuple[bool, str, Optional[str]]:
+    """Validate and normalize DBLP profile URL and extract its person ID.
     
     Args:
         url: URL to validate
         
     Returns:
-        Tuple of (is_valid, normalized_url_or_error_message)
+        Tuple of (is_valid, normalized_url_or_error_message, pid_or_None)
     """
     try:
-        scraper = DBLPScraper()
-        if not scraper.is_dblp_url(url):
-            return False, "URL is not a valid DBLP profile URL. Expected format: https://dblp.org/pid/X/Y.html"
-        
-        # Normalize URL
-        parsed = urlparse(url)
-        if not parsed.scheme:
-            url = f"https://{url}"
+        # The shared host check is cheap and rules out most non-DBLP input
+        if not is_dblp_host_url(url) or not _is_profile_url(urlparse(url)):
+            return False, "URL is not a valid DBLP profile URL. Expected format: https://dblp.org/pid/X/Y.html", None
         
         # Ensure .html extension for profile URLs
-        if '/pid/' in url and not url.endswith('.html') and not url.endswith('.bib'):
-            if not re.search(r'/pid/[^/]+/[^/]+$', url):
-                return False, "Invalid DBLP PID format"
+        if not url.endswith('.html') and not url.endswith('.bib'):
+            if not _PID_TAIL_RE.search(url):
+                return False, "Invalid DBLP PID format", None
             url = url + '.html'
         
-        return True, url
+        return True, url, _extract_pid(url)
         
     except Exception as e:
-        return False, f"Error validating URL: {e}"
+        return False, f"Error validating URL: {e}", None
+
+
+def validate_dblp_url(url: str) -> Tuple[bool, str]:
+    """Validate and normalize DBLP profile URL.
+    
+    Args:
+        url: URL to validate
+        
+    Returns:
+        Tuple of (is_valid, normalized_url_or_error_message)
+    """
+    is_valid, result, _ = parse_dblp_url(url)
+    return is_valid, result
 
 
 if __name__ == '__main__':
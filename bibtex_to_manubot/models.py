@@ -2,11 +2,22 @@
 Data models for BibTeX to Manubot conversion.
 """
 
+import re
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any, Mapping, Union
 from datetime import datetime
-import re
+
+# Models are plain dataclasses: one is built per BibTeX record, so they skip
+# per-field validation, and use __slots__ where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Uppercase keys bibtexparser (and our scanner) add to every record
+_RECORD_KEYS = frozenset(('ENTRYTYPE', 'ID'))
+
+# "and" between author names, with any surrounding whitespace
+_AUTHOR_SEPARATOR_RE = re.compile(r'\s+and\s+')
 
 
 class CitationType(str, Enum):
@@ -38,11 +49,12 @@ class BibTeXEntryType(str, Enum):
     UNPUBLISHED = "unpublished"
 
 
-class BibTeXEntry(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class BibTeXEntry:
     """Parsed BibTeX entry."""
     key: str  # BibTeX citation key
     entry_type: str  # Entry type (article, book, etc.)
-    fields: Dict[str, str]  # All BibTeX fields
+    fields: Mapping[str, str]  # All BibTeX fields; only read, so may be read-only
     
     # Common extracted fields
     title: Optional[str] = None
@@ -63,13 +75,16 @@ class BibTeXEntry(BaseModel):
     month: Optional[str] = None
     day: Optional[str] = None
     
-    def __init__(self, **data):
-        super().__init__(**data)
+    def __post_init__(self):
         self._extract_common_fields()
     
     def _extract_common_fields(self):
         """Extract common fields from the fields dictionary."""
-        fields = {k.lower(): v for k, v in self.fields.items()}
+        fields = self.fields
+        # Parsed records already use lowercase field names; only copy the
+        # dict when a caller passed mixed-case names
+        if not all(key.islower() or key in _RECORD_KEYS for key in fields):
+            fields = {k.lower(): v for k, v in fields.items()}
         
         self.title = fields.get('title')
         self.journal = fields.get('journal')
@@ -102,8 +117,12 @@ class BibTeXEntry(BaseModel):
     
     def _parse_authors(self, author_string: str) -> List[str]:
         """Parse BibTeX author string into list of names."""
-        # Split by 'and' but handle cases like "Smith and Jones"
-        authors = re.split(r'\s+and\s+', author_string)
+        # Split by 'and' but handle cases like "Smith and Jones"; when single
+        # spaces are the only whitespace, a plain split gives the same names
+        if author_string.isprintable() and '  ' not in author_string:
+            authors = author_string.split(' and ')
+        else:
+            authors = _AUTHOR_SEPARATOR_RE.split(author_string)
         
         # Clean up author names
         cleaned_authors = []
@@ -121,7 +140,8 @@ class BibTeXEntry(BaseModel):
         return cleaned_authors
 
 
-class ManubotCitation(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class ManubotCitation:
     """Manubot citation format."""
     id: str  # Manubot citation ID (e.g., "doi:10.1234/example")
     citation_type: CitationType
@@ -143,44 +163,41 @@ class ManubotCitation(BaseModel):
     original_key: Optional[str] = None
     bibtex_type: Optional[str] = None
     
-    @validator('id')
-    def validate_manubot_id(cls, v):
-        """Validate Manubot citation ID format."""
-        if ':' not in v:
+    def __post_init__(self):
+        """Validate the Manubot ID and coerce the citation type."""
+        if ':' not in self.id:
             raise ValueError("Manubot ID must contain a colon separator")
-        return v
+        # The converter always passes the enum member; only coerce plain strings
+        if type(self.citation_type) is not CitationType:
+            self.citation_type = CitationType(self.citation_type)
     
     def to_dict(self, include_metadata: bool = True) -> Dict[str, Any]:
         """Convert to dictionary for YAML output."""
-        result = {
-            'id': self.id,
-            'type': self.citation_type.value
-        }
+        pairs = [('id', self.id), ('type', self.citation_type.value)]
         
         if include_metadata:
-            if self.title:
-                result['title'] = self.title
-            if self.authors:
-                result['authors'] = self.authors
-            if self.journal:
-                result['publisher'] = self.journal  # Rename journal to publisher for website compatibility
-            if self.year:
-                result['year'] = self.year
-            if self.date:
-                result['date'] = self.date
-            if self.link:
-                result['link'] = self.link  # Use link instead of url for website compatibility
+            # journal and url are written as publisher and link for website compatibility
+            pairs += (
+                ('title', self.title),
+                ('authors', self.authors),
+                ('publisher', self.journal),
+                ('year', self.year),
+                ('date', self.date),
+                ('link', self.link),
+            )
         
-        return result
+        # Empty metadata is left out
+        return {key: value for key, value in pairs if value}
 
 
-class ConversionResult(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class ConversionResult:
     """Result of BibTeX to Manubot conversion."""
     original_key: str
     success: bool = False
     manubot_citation: Optional[ManubotCitation] = None
-    errors: List[str] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
     
     @property
     def citation_id(self) -> Optional[str]:
@@ -188,7 +205,8 @@ class ConversionResult(BaseModel):
         return self.manubot_citation.id if self.manubot_citation else None
 
 
-class BatchConversionResult(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class BatchConversionResult:
     """Result of batch BibTeX conversion."""
     input_files: List[str]
     total_entries: int
@@ -196,7 +214,7 @@ class BatchConversionResult(BaseModel):
     failed_conversions: int
     conversions: List[ConversionResult]
     processing_time: float
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     
     @property
     def success_rate(self) -> float:
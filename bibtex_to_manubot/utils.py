@@ -3,10 +3,185 @@ Utility functions for BibTeX to Manubot conversion.
 """
 
 import re
-from typing import Optional, List, Dict, Any
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 from urllib.parse import urlparse
 
 
+# Deletes BibTeX grouping braces, e.g. the case-protecting ones in {DNA}
+_BRACE_DELETE = str.maketrans('', '', '{}')
+
+# LaTeX commands that take a braced argument, applied in order before the
+# braces are removed (a command nested in another is rewritten by whichever
+# comes first here)
+_LATEX_COMMANDS = [
+    ('\\textit{', re.compile(r'\\textit\{([^}]+)\}'), r'*\1*'),
+    ('\\textbf{', re.compile(r'\\textbf\{([^}]+)\}'), r'**\1**'),
+    ('\\emph{', re.compile(r'\\emph\{([^}]+)\}'), r'*\1*'),
+    ('\\c{c}', re.compile(r'\\c\{c\}'), 'ç'),
+]
+
+# LaTeX accents and escaped characters
+_LATEX_ESCAPES = {
+    '\\"a': 'ä', '\\"o': 'ö', '\\"u': 'ü',
+    "\\'a": 'á', "\\'e": 'é', "\\'i": 'í', "\\'o": 'ó', "\\'u": 'ú',
+    '\\`a': 'à', '\\`e': 'è', '\\`i': 'ì', '\\`o': 'ò', '\\`u': 'ù',
+    '\\^a': 'â', '\\^e': 'ê', '\\^i': 'î', '\\^o': 'ô', '\\^u': 'û',
+    '\\~n': 'ñ', '\\~a': 'ã', '\\~o': 'õ',
+    '\\&': '&', '\\%': '%', '\\$': '$', '\\#': '#', '\\_': '_',
+}
+_LATEX_ESCAPE_TAILS = '|'.join(re.escape(escape[1:]) for escape in _LATEX_ESCAPES)
+
+# Every text the backslash pass can match, mapped to its literal replacement
+_LATEX_BACKSLASH_REPLACEMENTS = {**_LATEX_ESCAPES, '\\\\': '\n', '\\': ''}
+
+# One pass over every backslash: escapes first, then a "\\" line break
+# (unless its second backslash starts an escape), then any stray backslash
+_LATEX_BACKSLASH_RE = re.compile(
+    rf'\\(?:{_LATEX_ESCAPE_TAILS})|\\\\(?!{_LATEX_ESCAPE_TAILS})|\\'
+)
+
+
+def _wrapped_in_braces(field: str) -> bool:
+    """Check whether the first '{' of a field closes at its very end."""
+    if field[:1] != '{' or field[-1:] != '}':
+        return False
+    
+    depth = 0
+    for char in field[:-1]:
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                # e.g. "{A} and {B}": the first brace closes early
+                return False
+    return depth == 1
+
+
+def _latex_backslash(match) -> str:
+    """Replace a LaTeX escape, line break or stray backslash."""
+    return _LATEX_BACKSLASH_REPLACEMENTS[match.group()]
+
+
+# Double spaces and every ASCII whitespace character str.split() breaks on
+# besides the plain space
+_UNNORMALIZED_WHITESPACE = ('  ', '\t', '\n', '\r', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x1f')
+
+
+def _collapse_whitespace(field: str) -> str:
+    """Collapse whitespace runs to single spaces and strip the ends."""
+    # Fields that are already single-spaced ASCII only need their ends stripped
+    if field.isascii():
+        for run in _UNNORMALIZED_WHITESPACE:
+            if run in field:
+                break
+        else:
+            return field.strip()
+    return ' '.join(field.split())
+
+
+_DOI_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:doi:)\s*(10\.\d+/[^\s,}]+)',
+    r'(?:https?://(?:dx\.)?doi\.org/)(10\.\d+/[^\s,}]+)',
+    r'^(10\.\d+/[^\s,}]+)$',  # Just the DOI itself
+    r'(10\.\d+/[^\s,}]+)',    # DOI anywhere in text
+)]
+_DOI_TRAILING_RE = re.compile(r'[,;.\s]+$')
+
+_PMID_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:pmid:?)\s*(\d+)',
+    r'(?:pubmed\s*id:?)\s*(\d+)',
+    r'(?:pubmed:?)\s*(\d+)',
+    r'^(\d{7,8})$',  # Just the PMID number (7-8 digits)
+)]
+
+_PMCID_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:pmc:?)\s*(PMC\d+)',
+    r'(?:pmcid:?)\s*(PMC\d+)',
+    r'^(PMC\d+)$',  # Just the PMC ID
+    r'(PMC\d+)',    # PMC ID anywhere
+)]
+
+_ARXIV_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:arxiv:)\s*([\d.]+v?\d*)',
+    r'(?:arXiv:)\s*([\d.]+v?\d*)',
+    r'(?:https?://arxiv\.org/abs/)([\d.]+v?\d*)',
+    r'^([\d.]+v?\d*)$',  # Just the arXiv ID
+    r'(\d{4}\.\d{4,5}(?:v\d+)?)',  # New format: YYMM.NNNNN[vN]
+    r'([a-z-]+(?:\.[A-Z]{2})?/\d{7})',  # Old format: subject-class/YYMMnnn
+)]
+_ARXIV_NEW_ID_RE = re.compile(r'^\d{4}\.\d{4,5}(?:v\d+)?$')
+_ARXIV_OLD_ID_RE = re.compile(r'^[a-z-]+(?:\.[A-Z]{2})?/\d{7}$')
+_ARXIV_ID_RE = re.compile(r'^\d{4}\.\d{4,5}(?:v\d+)?$|^[a-z-]+(?:\.[A-Z]{2})?/\d{7}$')
+
+# Everything but ISBN digits and the X check digit
+_NON_ISBN_RE = re.compile(r'[^\dX]')
+_ISBN_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:isbn:?\s*)(978\d{10})',  # ISBN-13
+    r'(?:isbn:?\s*)(\d{9}[\dX])',  # ISBN-10
+    r'(978\d{10})',  # ISBN-13 anywhere
+    r'(\d{9}[\dX])',  # ISBN-10 anywhere
+)]
+
+# Name suffixes and titles dropped from the end of author names, in order
+_AUTHOR_SUFFIXES = ('Jr.', 'Sr.', 'III', 'II', 'IV', 'V', 'Ph.D.', 'Dr.', 'Prof.')
+_AUTHOR_SUFFIX_PATTERNS = [
+    re.compile(f'\\s+{re.escape(suffix)}\\s*$', re.IGNORECASE) for suffix in _AUTHOR_SUFFIXES
+]
+# Matches whenever any of the patterns above would
+_ANY_AUTHOR_SUFFIX_RE = re.compile(
+    '\\s+(?:' + '|'.join(re.escape(suffix) for suffix in _AUTHOR_SUFFIXES) + ')\\s*$',
+    re.IGNORECASE
+)
+
+# Month names, abbreviations and numbers as two-digit month numbers
+_MONTH_NUMBERS = {
+    'january': '01', 'jan': '01',
+    'february': '02', 'feb': '02',
+    'march': '03', 'mar': '03',
+    'april': '04', 'apr': '04',
+    'may': '05',
+    'june': '06', 'jun': '06',
+    'july': '07', 'jul': '07',
+    'august': '08', 'aug': '08',
+    'september': '09', 'sep': '09', 'sept': '09',
+    'october': '10', 'oct': '10',
+    'november': '11', 'nov': '11',
+    'december': '12', 'dec': '12',
+    **{str(n): f"{n:02d}" for n in range(1, 13)},
+    **{f"{n:02d}": f"{n:02d}" for n in range(1, 10)}
+}
+
+# Day numbers as two-digit days
+_DAY_NUMBERS = {
+    **{str(n): f"{n:02d}" for n in range(1, 32)},
+    **{f"{n:02d}": f"{n:02d}" for n in range(1, 10)}
+}
+
+# Day used when a date does not exist, e.g. Feb 31 (28 is safe for February)
+_LAST_DAY = {
+    '01': '31', '02': '28', '03': '31', '04': '30', '05': '31', '06': '30',
+    '07': '31', '08': '31', '09': '30', '10': '31', '11': '30', '12': '31'
+}
+
+_PAGE_DASHES_RE = re.compile(r'--+')
+_PAGE_HYPHEN_SPACE_RE = re.compile(r'\s*-\s*')
+
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\],;]+', re.IGNORECASE)
+_URL_TRAILING_RE = re.compile(r'[.,;)}\]]+$')
+
+# http(s) URL whose host is on dblp.org or its dblp.uni-trier.de mirror
+_DBLP_URL_RE = re.compile(r'https?://[^/]*(?:dblp\.org|dblp\.uni-trier\.de)/', re.IGNORECASE)
+
+
+# Journal, venue and author strings repeat across a bibliography, so field
+# cleaning is memoized too; at most this many strings are kept per helper
+_FIELD_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_FIELD_CACHE_SIZE)
 def clean_bibtex_field(field: str) -> str:
     """Clean BibTeX field by removing braces and LaTeX commands.
     
@@ -19,44 +194,38 @@ def clean_bibtex_field(field: str) -> str:
     if not field:
         return ""
     
-    # Remove outer braces
+    # Remove outer braces, however deeply the whole value is wrapped
     field = field.strip()
-    if field.startswith('{') and field.endswith('}'):
+    while _wrapped_in_braces(field):
         field = field[1:-1]
     
-    # Remove double braces
-    field = re.sub(r'\{\{([^}]+)\}\}', r'\1', field)
-    field = re.sub(r'\{([^}]+)\}', r'\1', field)
-    
-    # Convert common LaTeX commands
-    latex_replacements = {
-        r'\\textit\{([^}]+)\}': r'*\1*',
-        r'\\textbf\{([^}]+)\}': r'**\1**',
-        r'\\emph\{([^}]+)\}': r'*\1*',
-        r'\\"a': 'ä', r'\\"o': 'ö', r'\\"u': 'ü',
-        r'\\\'a': 'á', r'\\\'e': 'é', r'\\\'i': 'í', r'\\\'o': 'ó', r'\\\'u': 'ú',
-        r'\\`a': 'à', r'\\`e': 'è', r'\\`i': 'ì', r'\\`o': 'ò', r'\\`u': 'ù',
-        r'\\^a': 'â', r'\\^e': 'ê', r'\\^i': 'î', r'\\^o': 'ô', r'\\^u': 'û',
-        r'\\~n': 'ñ', r'\\~a': 'ã', r'\\~o': 'õ',
-        r'\\c\{c\}': 'ç',
-        r'\\&': '&',
-        r'\\%': '%',
-        r'\\\$': '$',
-        r'\\#': '#',
-        r'\\_': '_',
-        r'\\\\': '\n',
-        r'\\': ''
-    }
-    
-    for pattern, replacement in latex_replacements.items():
-        field = re.sub(pattern, replacement, field)
+    # Most fields are plain text with no braces or LaTeX left to clean
+    if '{' not in field and '}' not in field and '\\' not in field:
+        return _collapse_whitespace(field)
     
-    # Remove extra whitespace
-    field = ' '.join(field.split())
+    # Convert LaTeX commands while their braces are intact
+    if '\\' in field:
+        for command, pattern, replacement in _LATEX_COMMANDS:
+            if command in field:
+                field = pattern.sub(replacement, field)
     
-    return field.strip()
+    # Remove the remaining grouping braces
+    field = field.translate(_BRACE_DELETE)
+    
+    # Convert LaTeX escapes
+    if '\\' in field:
+        field = _LATEX_BACKSLASH_RE.sub(_latex_backslash, field)
+    
+    # Remove extra whitespace
+    return _collapse_whitespace(field)
+
 
+# Identifier helpers are pure functions of one string, and merged DBLP exports
+# repeat the same identifiers and URLs, so their results are memoized
+_IDENTIFIER_CACHE_SIZE = 8192
 
+
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def extract_doi(text: str) -> Optional[str]:
     """Extract and validate DOI from text.
     
@@ -69,26 +238,20 @@ def extract_doi(text: str) -> Optional[str]:
     if not text:
         return None
     
-    # DOI regex patterns
-    doi_patterns = [
-        r'(?:doi:)\s*(10\.\d+/[^\s,}]+)',
-        r'(?:https?://(?:dx\.)?doi\.org/)(10\.\d+/[^\s,}]+)',
-        r'^(10\.\d+/[^\s,}]+)$',  # Just the DOI itself
-        r'(10\.\d+/[^\s,}]+)',    # DOI anywhere in text
-    ]
-    
-    for pattern in doi_patterns:
-        match = re.search(pattern, text.strip(), re.IGNORECASE)
+    text = text.strip()
+    for pattern in _DOI_PATTERNS:
+        match = pattern.search(text)
         if match:
             doi = match.group(1)
             # Clean and validate
-            doi = re.sub(r'[,;.\s]+$', '', doi)  # Remove trailing punctuation
+            doi = _DOI_TRAILING_RE.sub('', doi)  # Remove trailing punctuation
             if validate_doi(doi):
                 return doi
     
     return None
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def validate_doi(doi: str) -> bool:
     """Validate DOI format.
     
@@ -101,11 +264,20 @@ def validate_doi(doi: str) -> bool:
     if not doi:
         return False
     
-    # DOI must start with "10." and have at least one "/"
-    pattern = r'^10\.\d{4,}/[^\s]+$'
-    return bool(re.match(pattern, doi.strip()))
+    # DOI must be "10.", a registrant code of 4+ digits, "/" and a suffix
+    # without whitespace
+    doi = doi.strip()
+    slash = doi.find('/')
+    return (
+        doi.startswith('10.')
+        and slash >= 7
+        and doi[3:slash].isdecimal()
+        and slash < len(doi) - 1
+        and len(doi.split(None, 1)) == 1
+    )
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def extract_pmid(text: str) -> Optional[str]:
     """Extract PMID from text.
     
@@ -118,15 +290,9 @@ def extract_pmid(text: str) -> Optional[str]:
     if not text:
         return None
     
-    patterns = [
-        r'(?:pmid:?)\s*(\d+)',
-        r'(?:pubmed\s*id:?)\s*(\d+)',
-        r'(?:pubmed:?)\s*(\d+)',
-        r'^(\d{7,8})$',  # Just the PMID number (7-8 digits)
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.strip(), re.IGNORECASE)
+    text = text.strip()
+    for pattern in _PMID_PATTERNS:
+        match = pattern.search(text)
         if match:
             pmid = match.group(1)
             # Validate PMID (should be 7-8 digits)
@@ -136,6 +302,7 @@ def extract_pmid(text: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def extract_pmcid(text: str) -> Optional[str]:
     """Extract PMC ID from text.
     
@@ -148,15 +315,9 @@ def extract_pmcid(text: str) -> Optional[str]:
     if not text:
         return None
     
-    patterns = [
-        r'(?:pmc:?)\s*(PMC\d+)',
-        r'(?:pmcid:?)\s*(PMC\d+)',
-        r'^(PMC\d+)$',  # Just the PMC ID
-        r'(PMC\d+)',    # PMC ID anywhere
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.strip(), re.IGNORECASE)
+    text = text.strip()
+    for pattern in _PMCID_PATTERNS:
+        match = pattern.search(text)
         if match:
             pmcid = match.group(1).upper()
             # Ensure it starts with PMC
@@ -166,6 +327,7 @@ def extract_pmcid(text: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def extract_arxiv_id(text: str) -> Optional[str]:
     """Extract arXiv ID from text.
     
@@ -178,27 +340,20 @@ def extract_arxiv_id(text: str) -> Optional[str]:
     if not text:
         return None
     
-    patterns = [
-        r'(?:arxiv:)\s*([\d.]+v?\d*)',
-        r'(?:arXiv:)\s*([\d.]+v?\d*)',
-        r'(?:https?://arxiv\.org/abs/)([\d.]+v?\d*)',
-        r'^([\d.]+v?\d*)$',  # Just the arXiv ID
-        r'(\d{4}\.\d{4,5}(?:v\d+)?)',  # New format: YYMM.NNNNN[vN]
-        r'([a-z-]+(?:\.[A-Z]{2})?/\d{7})',  # Old format: subject-class/YYMMnnn
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text.strip(), re.IGNORECASE)
+    text = text.strip()
+    for pattern in _ARXIV_PATTERNS:
+        match = pattern.search(text)
         if match:
             arxiv_id = match.group(1)
             # Basic validation for arXiv ID format
-            if (re.match(r'^\d{4}\.\d{4,5}(?:v\d+)?$', arxiv_id) or  # New format
-                re.match(r'^[a-z-]+(?:\.[A-Z]{2})?/\d{7}$', arxiv_id)):  # Old format
+            if (_ARXIV_NEW_ID_RE.match(arxiv_id) or  # New format
+                _ARXIV_OLD_ID_RE.match(arxiv_id)):  # Old format
                 return arxiv_id
     
     return None
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def extract_isbn(text: str) -> Optional[str]:
     """Extract ISBN from text.
     
@@ -211,8 +366,16 @@ def extract_isbn(text: str) -> Optional[str]:
     if not text:
         return None
     
+    # Bare ISBN-13 or ISBN-10 values need no cleaning
+    stripped = text.strip()
+    if len(stripped) == 13 and stripped.isdecimal():
+        return stripped
+    if len(stripped) == 10 and stripped[:9].isdecimal():
+        if stripped[9].isdecimal() or stripped[9] in 'Xx':
+            return stripped.upper()
+    
     # Remove all non-digit characters except 'X'
-    clean_text = re.sub(r'[^\dX]', '', text.upper())
+    clean_text = _NON_ISBN_RE.sub('', text.upper())
     
     # Check for ISBN-13 (13 digits)
     if len(clean_text) == 13 and clean_text.isdigit():
@@ -224,21 +387,15 @@ def extract_isbn(text: str) -> Optional[str]:
             return clean_text
     
     # Try to extract from longer strings
-    isbn_patterns = [
-        r'(?:isbn:?\s*)(978\d{10})',  # ISBN-13
-        r'(?:isbn:?\s*)(\d{9}[\dX])',  # ISBN-10
-        r'(978\d{10})',  # ISBN-13 anywhere
-        r'(\d{9}[\dX])',  # ISBN-10 anywhere
-    ]
-    
-    for pattern in isbn_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _ISBN_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1)
     
     return None
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def validate_url(url: str) -> bool:
     """Validate URL format.
     
@@ -267,6 +424,12 @@ def normalize_author_names(authors: List[str]) -> List[str]:
     Returns:
         List of normalized author names
     """
+    return list(_normalize_author_tuple(tuple(authors)))
+
+
+@lru_cache(maxsize=_FIELD_CACHE_SIZE)
+def _normalize_author_tuple(authors: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Normalize a tuple of author names (cached form of normalize_author_names)."""
     normalized = []
     
     for author in authors:
@@ -283,10 +446,10 @@ def normalize_author_names(authors: List[str]) -> List[str]:
                 if first and last:
                     author = f"{first} {last}"
         
-        # Remove common suffixes and titles
-        suffixes = ['Jr.', 'Sr.', 'III', 'II', 'IV', 'V', 'Ph.D.', 'Dr.', 'Prof.']
-        for suffix in suffixes:
-            author = re.sub(f'\\s+{re.escape(suffix)}\\s*$', '', author, flags=re.IGNORECASE)
+        # Remove common suffixes and titles (most names have none)
+        if _ANY_AUTHOR_SUFFIX_RE.search(author):
+            for pattern in _AUTHOR_SUFFIX_PATTERNS:
+                author = pattern.sub('', author)
         
         # Clean extra whitespace
         author = ' '.join(author.split())
@@ -294,7 +457,7 @@ def normalize_author_names(authors: List[str]) -> List[str]:
         if author:
             normalized.append(author)
     
-    return normalized
+    return tuple(normalized)
 
 
 def format_pages(pages_str: str) -> Optional[str]:
@@ -313,14 +476,26 @@ def format_pages(pages_str: str) -> Optional[str]:
     pages = pages_str.strip()
     
     # Convert double hyphens to single hyphen
-    pages = re.sub(r'--+', '-', pages)
+    pages = _PAGE_DASHES_RE.sub('-', pages)
     
     # Remove extra spaces around hyphens
-    pages = re.sub(r'\s*-\s*', '-', pages)
+    pages = _PAGE_HYPHEN_SPACE_RE.sub('-', pages)
     
     return pages if pages else None
 
 
+def is_dblp_host_url(url: str) -> bool:
+    """Check whether a URL is an http(s) URL on a DBLP host.
+    
+    Args:
+        url: URL to check
+        
+    Returns:
+        True if the host ends in dblp.org or dblp.uni-trier.de
+    """
+    return _DBLP_URL_RE.match(url) is not None
+
+
 def extract_bibtex_urls(text: str) -> List[str]:
     """Extract URLs from BibTeX field text.
     
@@ -330,18 +505,17 @@ def extract_bibtex_urls(text: str) -> List[str]:
     Returns:
         List of valid URLs
     """
-    if not text:
+    # Every URL has a scheme separator; most fields have none at all
+    if not text or '://' not in text:
         return []
     
-    # URL pattern
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\],;]+'
-    urls = re.findall(url_pattern, text, re.IGNORECASE)
+    urls = _URL_RE.findall(text)
     
     # Validate and clean URLs
     valid_urls = []
     for url in urls:
         # Remove trailing punctuation
-        url = re.sub(r'[.,;)}\]]+$', '', url)
+        url = _URL_TRAILING_RE.sub('', url)
         if validate_url(url):
             valid_urls.append(url)
     
@@ -361,6 +535,7 @@ def create_manubot_id(citation_type: str, identifier: str) -> str:
     return f"{citation_type.lower()}:{identifier}"
 
 
+@lru_cache(maxsize=_IDENTIFIER_CACHE_SIZE)
 def validate_manubot_id(manubot_id: str) -> bool:
     """Validate Manubot citation ID format.
     
@@ -387,9 +562,9 @@ def validate_manubot_id(manubot_id: str) -> bool:
     elif citation_type == 'pmcid':
         return identifier.startswith('PMC') and identifier[3:].isdigit()
     elif citation_type == 'arxiv':
-        return bool(re.match(r'^\d{4}\.\d{4,5}(?:v\d+)?$|^[a-z-]+(?:\.[A-Z]{2})?/\d{7}$', identifier))
+        return bool(_ARXIV_ID_RE.match(identifier))
     elif citation_type == 'isbn':
-        clean_id = re.sub(r'[^\dX]', '', identifier.upper())
+        clean_id = _NON_ISBN_RE.sub('', identifier.upper())
         return len(clean_id) in (10, 13)
     elif citation_type == 'url':
         return validate_url(identifier)
@@ -420,55 +595,36 @@ def generate_publication_date(year: Optional[int], month: Optional[str] = None,
     # Parse month if provided
     if month:
         month = month.strip().lower()
-        month_mapping = {
-            'january': '01', 'jan': '01',
-            'february': '02', 'feb': '02',
-            'march': '03', 'mar': '03',
-            'april': '04', 'apr': '04',
-            'may': '05',
-            'june': '06', 'jun': '06',
-            'july': '07', 'jul': '07',
-            'august': '08', 'aug': '08',
-            'september': '09', 'sep': '09', 'sept': '09',
-            'october': '10', 'oct': '10',
-            'november': '11', 'nov': '11',
-            'december': '12', 'dec': '12'
-        }
-        
-        if month in month_mapping:
-            month_num = month_mapping[month]
-        elif month.isdigit() and 1 <= int(month) <= 12:
-            month_num = f"{int(month):02d}"
-        else:
-            month_num = default_month
+        month_num = _MONTH_NUMBERS.get(month)
+        if month_num is None:
+            # Less common spellings such as "012"
+            if month.isdigit() and 1 <= int(month) <= 12:
+                month_num = f"{int(month):02d}"
+            else:
+                month_num = default_month
     else:
         month_num = default_month
     
     # Parse day if provided
     if day:
         day = day.strip()
-        if day.isdigit() and 1 <= int(day) <= 31:
-            day_num = f"{int(day):02d}"
-        else:
-            day_num = default_day
+        day_num = _DAY_NUMBERS.get(day)
+        if day_num is None:
+            if day.isdigit() and 1 <= int(day) <= 31:
+                day_num = f"{int(day):02d}"
+            else:
+                day_num = default_day
     else:
         day_num = default_day
     
     # Validate the date doesn't exceed month limits
     try:
-        from datetime import datetime
         datetime(year, int(month_num), int(day_num))
-        return f"{year}-{month_num}-{day_num}"
     except ValueError:
         # If invalid date (e.g., Feb 31), use last day of month
-        if month_num in ['02']:
-            day_num = '28'  # Safe for February
-        elif month_num in ['04', '06', '09', '11']:
-            day_num = '30'  # 30-day months
-        else:
-            day_num = '31'  # 31-day months
-        
-        return f"{year}-{month_num}-{day_num}"
+        day_num = _LAST_DAY[month_num]
+    
+    return f"{year}-{month_num}-{day_num}"
 
 
 def parse_bibtex_date_fields(fields: Dict[str, str]) -> Dict[str, Optional[str]]:
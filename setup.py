@@ -38,12 +38,16 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
+            "pytest-xdist>=3.0.0",
             "pytest-asyncio>=0.21.0",
             "black>=23.0.0",
             "flake8>=5.0.0",
             "mypy>=1.0.0",
             "coverage>=7.0.0",
         ],
+        "lxml": [
+            "lxml>=4.9.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -2,160 +2,558 @@
 Unit tests for BibTeX to Manubot converter.
 """
 
-import unittest
+from collections import Counter
+import io
+import itertools
+import types
+import json
+from dataclasses import asdict
 from unittest.mock import patch, mock_open
-from pathlib import Path
-import tempfile
+import pytest
 import yaml
 
 from bibtex_to_manubot import BibTeXConverter
-from bibtex_to_manubot.models import BibTeXEntry, ManubotCitation
-
-
-class TestBibTeXConverter(unittest.TestCase):
-    """Test BibTeX to Manubot converter functionality."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.converter = BibTeXConverter()
-    
-    def test_convert_entry_with_doi(self):
-        """Test converting entry with DOI."""
-        entry = BibTeXEntry(
-            key="test2023",
-            entry_type="article",
-            fields={
-                "title": "Test Paper",
-                "author": "John Doe and Jane Smith",
-                "journal": "Nature",
-                "year": "2023",
-                "doi": "10.1234/example"
-            }
-        )
-        
-        result = self.converter.convert_entry(entry)
-        
-        self.assertTrue(result.success)
-        self.assertEqual(result.manubot_citation.id, "doi:10.1234/example")
-        self.assertEqual(result.manubot_citation.citation_type, "doi")
-        self.assertEqual(result.manubot_citation.title, "Test Paper")
-        self.assertEqual(result.manubot_citation.authors, ["John Doe", "Jane Smith"])
-        self.assertEqual(result.manubot_citation.year, 2023)
-    
-    def test_convert_entry_with_pmid(self):
-        """Test converting entry with PMID."""
-        entry = BibTeXEntry(
-            key="test2023",
-            entry_type="article",
-            fields={
-                "title": "Medical Paper",
-                "author": "Dr. Smith",
-                "year": "2023",
-                "pmid": "12345678"
-            }
-        )
-        
-        result = self.converter.convert_entry(entry)
-        
-        self.assertTrue(result.success)
-        self.assertEqual(result.manubot_citation.id, "pmid:12345678")
-        self.assertEqual(result.manubot_citation.citation_type, "pmid")
-    
-    def test_convert_entry_with_arxiv(self):
-        """Test converting entry with arXiv ID."""
-        entry = BibTeXEntry(
-            key="test2023",
-            entry_type="article",
-            fields={
-                "title": "arXiv Paper",
-                "author": "Researcher A",
-                "year": "2023",
-                "eprint": "2301.12345",
-                "archivePrefix": "arXiv"
-            }
-        )
-        
-        result = self.converter.convert_entry(entry)
-        
-        self.assertTrue(result.success)
-        self.assertEqual(result.manubot_citation.id, "arxiv:2301.12345")
-        self.assertEqual(result.manubot_citation.citation_type, "arxiv")
-    
-    def test_convert_entry_fallback_to_raw(self):
-        """Test fallback to raw citation when no identifiers available."""
-        entry = BibTeXEntry(
-            key="test2023",
-            entry_type="article",
-            fields={
-                "title": "Paper Without Identifiers",
-                "author": "Unknown Author",
-                "year": "2023",
-                "journal": "Unknown Journal"
-            }
-        )
-        
-        result = self.converter.convert_entry(entry)
-        
-        self.assertTrue(result.success)
-        self.assertEqual(result.manubot_citation.id, "raw:test2023")
-        self.assertEqual(result.manubot_citation.citation_type, "raw")
-    
-    def test_validate_manubot_format(self):
-        """Test YAML format validation."""
-        # Create temporary YAML file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump([
-                {
-                    'id': 'doi:10.1234/example',
-                    'type': 'doi',
-                    'title': 'Test Paper',
-                    'authors': ['John Doe'],
-                    'year': 2023
-                }
-            ], f)
-            temp_path = Path(f.name)
-        
-        try:
-            result = self.converter.validate_manubot_format(temp_path)
-            
-            self.assertTrue(result['valid'])
-            self.assertEqual(result['citation_count'], 1)
-            self.assertIn('doi', result['citation_types'])
-            self.assertEqual(result['citation_types']['doi'], 1)
-        
-        finally:
-            temp_path.unlink()
-    
-    def test_basic_functionality(self):
-        """Test basic converter functionality."""
-        # Just test that the converter can be instantiated
-        self.assertIsNotNone(self.converter)
-        self.assertTrue(hasattr(self.converter, 'convert_entry'))
-        self.assertTrue(hasattr(self.converter, 'parse_bibtex_file'))
-
-
-class TestManubotCitation(unittest.TestCase):
-    """Test Manubot citation model."""
-    
-    def test_citation_creation(self):
-        """Test creating Manubot citation."""
-        citation = ManubotCitation(
-            id="doi:10.1234/example",
-            citation_type="doi",
-            identifier="10.1234/example",
-            title="Test Paper",
-            authors=["John Doe"],
-            year=2023,
-            publisher="Nature"
-        )
-        
-        self.assertEqual(citation.id, "doi:10.1234/example")
-        self.assertEqual(citation.citation_type, "doi")
-        self.assertEqual(citation.title, "Test Paper")
-        self.assertEqual(citation.authors, ["John Doe"])
-        self.assertEqual(citation.year, 2023)
-        self.assertEqual(citation.publisher, "Nature")
+from bibtex_to_manubot.config import Config, get_yaml_dumper, get_yaml_loader
+from bibtex_to_manubot.models import BatchConversionResult, BibTeXEntry, CitationType, ManubotCitation
+from bibtex_to_manubot.utils import clean_bibtex_field, is_dblp_host_url
+
+# Resolve the YAML classes once; libyaml's when it is installed
+_DUMPER = get_yaml_dumper()
+_LOADER = get_yaml_loader()
+
+
+@pytest.fixture(scope="module")
+def converter():
+    """Share one converter across the module's function tests."""
+    return BibTeXConverter()
+
+
+_MANUBOT_CITATIONS = [
+    {
+        'id': 'doi:10.1234/example',
+        'type': 'doi',
+        'title': 'Test Paper',
+        'authors': ['John Doe'],
+        'year': 2023
+    }
+]
+
+# _MANUBOT_CITATIONS as YAML, written verbatim so no test pays for the dump
+_YAML_BYTES = b"""\
+- id: doi:10.1234/example
+  type: doi
+  title: Test Paper
+  authors:
+  - John Doe
+  year: 2023
+"""
+
+
+@pytest.fixture(scope="session")
+def manubot_yaml_path(tmp_path_factory):
+    """Write the sample Manubot YAML file once per test session."""
+    path = tmp_path_factory.mktemp("manubot") / "citations.yaml"
+    path.write_bytes(_YAML_BYTES)
+    return path
+
+
+@pytest.fixture(scope="session")
+def manubot_json_path(tmp_path_factory):
+    """Write the sample citations as JSON, which the YAML loader also reads."""
+    path = tmp_path_factory.mktemp("manubot") / "citations.json"
+    path.write_text(json.dumps(_MANUBOT_CITATIONS), encoding='utf-8')
+    return path
+
+
+# Entries are built once at import, with read-only fields so no test can
+# change them for another
+_DOI_ENTRY = BibTeXEntry(
+    key="test2023",
+    entry_type="article",
+    fields=types.MappingProxyType({
+        "title": "Test Paper",
+        "author": "John Doe and Jane Smith",
+        "journal": "Nature",
+        "year": "2023",
+        "doi": "10.1234/example"
+    })
+)
+_PMID_ENTRY = BibTeXEntry(
+    key="test2023",
+    entry_type="article",
+    fields=types.MappingProxyType({
+        "title": "Medical Paper",
+        "author": "Dr. Smith",
+        "year": "2023",
+        "pmid": "12345678"
+    })
+)
+_ARXIV_ENTRY = BibTeXEntry(
+    key="test2023",
+    entry_type="article",
+    fields=types.MappingProxyType({
+        "title": "arXiv Paper",
+        "author": "Researcher A",
+        "year": "2023",
+        "eprint": "2301.12345",
+        "archivePrefix": "arXiv"
+    })
+)
+# No identifiers: falls back to a raw citation
+_RAW_ENTRY = BibTeXEntry(
+    key="test2023",
+    entry_type="article",
+    fields=types.MappingProxyType({
+        "title": "Paper Without Identifiers",
+        "author": "Unknown Author",
+        "year": "2023",
+        "journal": "Unknown Journal"
+    })
+)
+
+CASES = [
+    (_DOI_ENTRY, {
+        'id': "doi:10.1234/example",
+        'citation_type': "doi",
+        'title': "Test Paper",
+        'authors': ["John Doe", "Jane Smith"],
+        'year': 2023
+    }),
+    (_PMID_ENTRY, {
+        'id': "pmid:12345678",
+        'citation_type': "pmid",
+        'title': "Medical Paper",
+        'authors': ["Dr. Smith"],
+        'year': 2023
+    }),
+    (_ARXIV_ENTRY, {
+        'id': "arxiv:2301.12345",
+        'citation_type': "arxiv",
+        'title': "arXiv Paper",
+        'authors': ["Researcher A"],
+        'year': 2023
+    }),
+    (_RAW_ENTRY, {
+        'id': "raw:test2023",
+        'citation_type': "raw",
+        'title': "Paper Without Identifiers",
+        'authors': ["Unknown Author"],
+        'year': 2023
+    }),
+]
+
+
+@pytest.mark.parametrize("entry,expected", CASES)
+def test_convert_entry(converter, entry, expected):
+    """Test converting entries picks the expected citation identifier."""
+    result = converter.convert_entry(entry)
+    
+    assert result.success, result.errors
+    citation = asdict(result.manubot_citation)
+    assert {key: citation[key] for key in expected} == expected
+
+
+# Identifier fields in priority order, with the citation ID each one yields
+PRIORITY = [
+    ({"doi": "10.1234/example"}, "doi:10.1234/example"),
+    ({"pmid": "12345678"}, "pmid:12345678"),
+    ({"pmcid": "PMC1234567"}, "pmcid:PMC1234567"),
+    ({"eprint": "2301.12345", "archivePrefix": "arXiv"}, "arxiv:2301.12345"),
+]
+
+
+@pytest.mark.parametrize("present", list(itertools.product([False, True], repeat=len(PRIORITY))))
+def test_identifier_priority(converter, present):
+    """Test the highest-priority identifier present wins, else a raw citation."""
+    fields = {"title": "Test Paper", "year": "2023"}
+    for is_present, (identifier_fields, _) in zip(present, PRIORITY):
+        if is_present:
+            fields.update(identifier_fields)
+    expected_id = next(
+        (citation_id for is_present, (_, citation_id) in zip(present, PRIORITY) if is_present),
+        "raw:test2023"
+    )
+    
+    result = converter.convert_entry(BibTeXEntry(key="test2023", entry_type="article", fields=fields))
+    
+    assert result.success, result.errors
+    assert result.manubot_citation.id == expected_id
+
+
+def test_validate_manubot_format(converter, manubot_yaml_path):
+    """Test YAML format validation."""
+    result = converter.validate_manubot_format(manubot_yaml_path)
+    
+    assert result['valid']
+    assert result['citation_count'] == 1
+    assert result['citation_types'] == Counter({'doi': 1})
+
+
+def test_validate_manubot_format_json(converter, manubot_yaml_path, manubot_json_path):
+    """Test JSON citation files validate the same as their YAML form."""
+    assert yaml.load(_YAML_BYTES, Loader=_LOADER) == _MANUBOT_CITATIONS
+    assert converter.validate_manubot_format(manubot_json_path) == \
+        converter.validate_manubot_format(manubot_yaml_path)
+
+
+def test_validate_manubot_format_documents(converter, tmp_path):
+    """Test citations split across YAML documents are all validated."""
+    citations = [
+        {'id': f'doi:10.1234/example.{i}', 'type': 'doi', 'title': f'Paper {i}',
+         'authors': ['John Doe'], 'year': 2023}
+        for i in range(1000)
+    ]
+    citations[1]['type'] = 'arxiv'
+    yaml_path = tmp_path / "citations.yaml"
+    with yaml_path.open('w', encoding='utf-8') as f:
+        yaml.dump_all(citations, f, Dumper=_DUMPER)
+    
+    result = converter.validate_manubot_format(yaml_path)
+    
+    assert result['valid']
+    assert result['citation_count'] == 1000
+    assert result['citation_types'] == Counter(citation['type'] for citation in citations)
+
+
+def test_save_yaml_validates_like_conversions(converter, tmp_path):
+    """Test files from save_yaml validate the same as the in-memory results."""
+    conversions = [converter.convert_entry(entry) for entry, _ in CASES]
+    batch_result = BatchConversionResult(
+        input_files=[],
+        total_entries=len(conversions),
+        successful_conversions=len(conversions),
+        failed_conversions=0,
+        conversions=conversions,
+        processing_time=0.0
+    )
+    yaml_path = tmp_path / "citations.yaml"
+    
+    with patch('builtins.print'):
+        converter.save_yaml(batch_result, yaml_path)
+    
+    assert converter.validate_manubot_format(yaml_path) == converter.validate_citations(conversions)
+
+
+def test_validate_citations_matches_saved_file(converter, tmp_path):
+    """Test in-memory validation covers exactly what save_yaml writes."""
+    preprint = BibTeXEntry(key="he2015", entry_type="article", fields={
+        "title": "Deep Residual Learning for Image Recognition",
+        "author": "Kaiming He",
+        "journal": "CoRR",
+        "year": "2015",
+        "eprint": "1512.03385",
+        "archivePrefix": "arXiv"
+    })
+    published = BibTeXEntry(key="he2016", entry_type="inproceedings", fields={
+        "title": "Deep Residual Learning for Image Recognition",
+        "author": "Kaiming He",
+        "booktitle": "CVPR",
+        "year": "2016",
+        "doi": "10.1109/CVPR.2016.90"
+    })
+    conversions = [converter.convert_entry(preprint), converter.convert_entry(published)]
+    batch_result = BatchConversionResult(
+        input_files=[],
+        total_entries=2,
+        successful_conversions=2,
+        failed_conversions=0,
+        conversions=conversions,
+        processing_time=0.0
+    )
+    yaml_path = tmp_path / "citations.yaml"
+    
+    with patch('builtins.print'):
+        converter.save_yaml(batch_result, yaml_path)
+    result = converter.validate_citations(conversions)
+    
+    assert result == converter.validate_manubot_format(yaml_path)
+    assert result['citation_count'] == 1
+    assert result['citation_types'] == Counter({'doi': 1})
+
+
+def test_batch_convert_with_worker_processes(tmp_path):
+    """Test parallel entry conversion matches serial conversion."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump({'conversion': {'max_workers': 2, 'parallel_threshold': 1}}, Dumper=_DUMPER)
+    )
+    bib_path = tmp_path / "papers.bib"
+    bib_path.write_text(''.join(
+        f"@article{{paper{i},\n  title={{Paper {i}}},\n  year={{2023}},\n"
+        f"  doi={{10.1234/example.{i}}}\n}}\n\n"
+        for i in range(5)
+    ))
+    
+    parallel = BibTeXConverter(str(config_path)).batch_convert([bib_path])
+    serial = BibTeXConverter().batch_convert([bib_path])
+    
+    assert parallel.successful_conversions == 5
+    assert [r.manubot_citation.id for r in parallel.conversions] == \
+        [r.manubot_citation.id for r in serial.conversions]
+
+
+def test_worker_converter_converts_in_process(tmp_path):
+    """Test a converter inside a worker never starts a nested process pool."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump({'conversion': {'max_workers': 2, 'parallel_threshold': 1}}, Dumper=_DUMPER)
+    )
+    bib_path = tmp_path / "papers.bib"
+    bib_path.write_text("@article{paper,\n  title={Paper},\n  doi={10.1234/example}\n}\n")
+    
+    with patch('bibtex_to_manubot.converter.ProcessPoolExecutor', side_effect=AssertionError):
+        result = BibTeXConverter(str(config_path), in_worker=True).batch_convert([bib_path])
+    
+    assert result.successful_conversions == 1
+
+
+def test_convert_files_in_parallel_above_threshold(tmp_path):
+    """Test per-file workers convert large files without nested pools."""
+    from bibtex_to_manubot.commands.convert import _convert_one, _convert_parallel
+    
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        yaml.dump({'conversion': {'max_workers': 2, 'parallel_threshold': 1}}, Dumper=_DUMPER)
+    )
+    bib_paths = []
+    for name in ('a', 'b'):
+        bib_path = tmp_path / f"{name}.bib"
+        bib_path.write_text(''.join(
+            f"@article{{{name}{i},\n  title={{Paper {name} {i}}},\n  year={{2023}},\n"
+            f"  doi={{10.1234/{name}.{i}}}\n}}\n\n"
+            for i in range(3)
+        ))
+        bib_paths.append(str(bib_path))
+    
+    with patch('bibtex_to_manubot.converter.ProcessPoolExecutor', side_effect=AssertionError):
+        assert len(_convert_one(bib_paths[0], str(config_path))) == 3
+    
+    converter = BibTeXConverter(str(config_path))
+    with patch('builtins.print'):
+        result = _convert_parallel(converter, bib_paths, str(config_path), str(tmp_path / "out.yaml"))
+    
+    assert result.successful_conversions == 6
+    assert [r.manubot_citation.id for r in result.conversions] == \
+        [f"doi:10.1234/{name}.{i}" for name in ('a', 'b') for i in range(3)]
+
+
+def test_remove_arxiv_duplicates(converter):
+    """Test arXiv preprints are dropped when a published version exists."""
+    citations = [
+        {'id': 'arxiv:1', 'publisher': 'CoRR',
+         'title': 'Deep Residual Learning for Image Recognition at Scale'},
+        {'id': 'arxiv:2', 'publisher': 'CoRR',
+         'title': 'An Unrelated Preprint About Graph Neural Networks'},
+        {'id': 'doi:1', 'publisher': 'IEEE',
+         'title': 'Deep residual learning for image recognition'},
+    ]
+    
+    assert converter._find_title_overlap(citations[0]['title'], citations[2]['title']) == 6
+    with patch('builtins.print'):
+        remaining = converter._remove_arxiv_duplicates(citations)
+    
+    assert [c['id'] for c in remaining] == ['arxiv:2', 'doi:1']
+
+
+def test_emit_citation_round_trips():
+    """Test the YAML citation emitter output loads back unchanged."""
+    from bibtex_to_manubot.converter import _emit_citation
+    
+    citation = {
+        'id': 'doi:10.1234/example',
+        'type': 'doi',
+        'title': "Yes: A 'Quoted' #1 Study\nof - things:",
+        'authors': ['Müller, Jan', '- Dash', 'null'],
+        'publisher': '2023-01-01',
+        'year': 2023,
+    }
+    
+    text = _emit_citation(citation)
+    
+    assert text.startswith('- id: doi:10.1234/example\n  type: doi\n')
+    assert yaml.load(text, Loader=_LOADER) == [citation]
+    assert _emit_citation({'id': 'raw:x', 'extra': {'nested': True}}) is None
+
+
+def test_validate_citations(converter):
+    """Test in-memory validation of conversion results."""
+    result = converter.validate_citations([converter.convert_entry(_DOI_ENTRY)])
+    
+    assert result['valid']
+    assert result['citation_count'] == 1
+    assert result['citation_types'] == {'doi': 1}
+    assert result['warnings'] == []
+
+
+def test_parse_bibtex_stream():
+    """Test parsing BibTeX from a binary stream."""
+    stream = io.BytesIO(
+        b"@article{test2023,\n"
+        b"  title={Stream Paper},\n"
+        b"  author={Doe, John},\n"
+        b"  year={2023},\n"
+        b"  doi={10.1234/example}\n"
+        b"}\n"
+    )
+    
+    entries = BibTeXConverter().parse_bibtex_stream(stream)
+    
+    assert len(entries) == 1
+    assert entries[0].key == "test2023"
+    assert entries[0].title == "Stream Paper"
+    assert entries[0].doi == "10.1234/example"
+    assert not stream.closed
+
+
+def test_parse_twice_does_not_accumulate(converter):
+    """Test repeated parses on one converter return only their own entries."""
+    content = b"@article{test2023,\n  title={Stream Paper},\n  year={2023}\n}\n"
+    
+    first = converter.parse_bibtex_stream(io.BytesIO(content))
+    second = converter.parse_bibtex_stream(io.BytesIO(content))
+    
+    assert len(first) == 1
+    assert len(second) == 1
+    
+    # The bibtexparser fallback reuses its parser but not its database
+    fallback = b'@string{venue = "Nature"}\n' + content
+    for _ in range(2):
+        assert len(converter.parse_bibtex_stream(io.BytesIO(fallback))) == 1
+
+
+def test_fast_scanner_matches_bibtexparser(converter):
+    """Test the fast BibTeX scanner yields the same records as bibtexparser."""
+    import bibtexparser
+    from bibtex_to_manubot.converter import _scan_bibtex
+    
+    content = (
+        '@Article{DBLP:journals/x/Muller23,\n'
+        '  Title  = {A {Study} of M{\\"u}ller\'s\n'
+        '            Method},\n'
+        '  author = "M{\\"u}ller, Jan and Doe, J.",\n'
+        '  year   = 2023,\n'
+        '  doi    = {10.1234/example},\n'
+        '}\n'
+        '@misc{second, title={Second}}\n'
+    )
+    
+    records = _scan_bibtex(content)
+    expected = bibtexparser.loads(content, parser=converter._new_parser()).entries
+    
+    assert [list(r.items()) for r in records] == [list(e.items()) for e in expected]
+    assert records[0]['author'] == 'Müller, Jan and Doe, J.'
+    # Constructs outside the plain subset are left to bibtexparser
+    assert _scan_bibtex('@string{x = "y"}\n' + content) is None
+    assert _scan_bibtex('@misc{k, note = {a} # {b}}') is None
+
+
+def test_basic_functionality(converter):
+    """Test basic converter functionality."""
+    assert {'convert_entry', 'parse_bibtex_file'} <= set(dir(converter))
+
+
+_SAMPLE_CITATION = ManubotCitation(
+    id="doi:10.1234/example",
+    citation_type="doi",
+    identifier="10.1234/example",
+    title="Test Paper",
+    authors=["John Doe"],
+    year=2023,
+    publisher="Nature"
+)
+
+
+def test_citation_creation():
+    """Test creating Manubot citation."""
+    citation = _SAMPLE_CITATION
+    
+    assert citation.id == "doi:10.1234/example"
+    assert citation.citation_type == "doi"
+    assert citation.title == "Test Paper"
+    assert citation.authors == ["John Doe"]
+    assert citation.year == 2023
+    assert citation.publisher == "Nature"
+
+
+def test_citation_validation():
+    """Test citation IDs need a colon and types are coerced to the enum."""
+    citation = ManubotCitation(id="raw:key", citation_type="raw", identifier="key")
+    
+    assert citation.citation_type is CitationType.RAW
+    assert citation.to_dict() == {'id': 'raw:key', 'type': 'raw'}
+    with pytest.raises(ValueError):
+        ManubotCitation(id="no-colon", citation_type="raw", identifier="key")
+
+
+def test_clean_bibtex_field():
+    """Test braces, LaTeX commands and escapes are cleaned."""
+    assert clean_bibtex_field('{A {DNA} Study}') == 'A DNA Study'
+    assert clean_bibtex_field('{{Nested Title}}') == 'Nested Title'
+    assert clean_bibtex_field('{A} and {B}') == 'A and B'
+    assert clean_bibtex_field('\\textit{In vivo} Fa\\c{c}ade of M{\\"u}ller') == '*In vivo* Façade of Müller'
+    assert clean_bibtex_field('M\\"uller \\& Ca\\~nas') == 'Müller & Cañas'
+    assert clean_bibtex_field('R\\^ole of 100\\% \\`a la carte') == 'Rôle of 100% à la carte'
+    assert clean_bibtex_field('Line\\\\break') == 'Line break'
+    assert clean_bibtex_field('') == ''
+
+
+@pytest.mark.parametrize("url,expected", [
+    ("https://dblp.org/pid/154/4313.html", True),
+    ("https://dblp.uni-trier.de/pid/154/4313", True),
+    ("https://dblp.org.example.com/pid/154/4313", False),
+    ("https://dblp.org-mirror.example/pid/154/4313", False),
+    ("papers.bib", False),
+])
+def test_is_dblp_host_url(url, expected):
+    """Test DBLP detection requires the host itself to be a DBLP host."""
+    assert is_dblp_host_url(url) is expected
+
+
+def test_get_with_cached_paths():
+    """Test dot-path lookups return the same values once cached."""
+    config = Config()
+    
+    for _ in range(2):
+        assert config.get('output.include_metadata')
+        assert config.get('bibtex.encoding') == 'utf-8'
+        assert config.get('output.missing') is None
+        assert config.get('output.missing', 'fallback') == 'fallback'
+
+
+def test_priority_order_and_set():
+    """Test citation priority is exposed as an ordered tuple and a set."""
+    config = Config()
+    
+    assert config.priority_order == ('doi', 'pmid', 'pmcid', 'arxiv', 'isbn', 'url')
+    assert config.priority_set == frozenset(config.priority_order)
+    assert config.priority_order is config.priority_order
+
+
+def test_assigning_config_clears_cache():
+    """Test replacing the configuration dictionary drops cached lookups."""
+    config = Config()
+    assert config.get('output.include_metadata')
+    assert config.priority_order[0] == 'doi'
+    
+    config.config = {'output': {'include_metadata': False}, 'citation_priority': ['pmid']}
+    
+    assert not config.get('output.include_metadata')
+    assert config.priority_order == ('pmid',)
+    assert config.priority_set == frozenset(('pmid',))
+
+
+def test_reload_clears_cache(tmp_path):
+    """Test reloading picks up changes to the configuration file."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({'output': {'include_metadata': False}}, Dumper=_DUMPER))
+    
+    config = Config(str(config_path))
+    assert not config.get('output.include_metadata')
+    
+    config_path.write_text(yaml.dump({'output': {'include_metadata': True}}, Dumper=_DUMPER))
+    config.reload()
+    assert config.get('output.include_metadata')
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
\ No newline at end of file